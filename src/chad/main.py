@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from .utils import chad, config, validate
+from .utils import cache, chad, config, validate
 
 import datetime
 
@@ -33,11 +33,13 @@ def main():
 			args.maximum_queries,
 			args.minimum_pages,
 			args.maximum_pages,
+			args.query_budget,
 			args.playwright,
 			args.cookie,
 			args.user_agents,
 			args.proxies,
 			not args.no_sleep_on_start,
+			cache.Cache(args.cache, args.cache_ttl, args.refresh) if args.cache else None,
 			args.debug
 		)
 		if tool.prepare() and tool.run():
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+from . import config
+
+import hashlib, json, os, threading, time, typing
+
+class Cache:
+
+	def __init__(self, path: str, ttl: int, refresh: bool):
+		"""
+		Class for caching the results of Google Dorks in a JSON file, shared between multiple threads.\n
+		Results older than `ttl` hours are ignored and eventually removed.\n
+		If `refresh` is `True`, results are only written, never read.\n
+		New results are saved in batches, call `save()` once the search is done.
+		"""
+		self.__path    = path
+		self.__ttl     = ttl * 3600
+		self.__refresh = refresh
+		self.__lock    = threading.Lock()
+		self.__entries = self.__load()
+		self.__unsaved = 0
+
+	def __load(self) -> dict[str, dict[str, typing.Any]]:
+		"""
+		Load the cache file.\n
+		Returns an empty dictionary if the file does not exist or is invalid.
+		"""
+		tmp = {}
+		try:
+			with open(self.__path, "r", encoding = "UTF-8") as stream:
+				tmp = json.load(stream)
+			if not isinstance(tmp, dict):
+				tmp = {}
+		except (OSError, ValueError):
+			pass
+		return tmp
+
+	def __save(self):
+		"""
+		Save the cache file, without the expired results.\n
+		The file is replaced at once, so it is never left half-written.
+		"""
+		now            = time.time()
+		self.__entries = {key: entry for key, entry in self.__entries.items() if self.__is_fresh(entry, now)}
+		self.__unsaved = 0
+		tmp            = f"{self.__path}.tmp"
+		try:
+			with open(tmp, "w", encoding = "UTF-8") as stream:
+				json.dump(self.__entries, stream, indent = 4, ensure_ascii = False)
+			os.replace(tmp, self.__path)
+		except OSError:
+			pass
+
+	def __get_key(self, query: str, tbs: str, total_results: int, backend: str):
+		"""
+		Get a unique key for the specified Google search.
+		"""
+		return hashlib.sha256(json.dumps([query, tbs, total_results, backend]).encode()).hexdigest()
+
+	def __is_fresh(self, entry: dict[str, typing.Any], now: float):
+		"""
+		Returns `True` if the cached result has not expired.\n
+		Malformed results are treated as expired.
+		"""
+		if not isinstance(entry, dict):
+			return False
+		cached_at = entry.get("cached_at")
+		return isinstance(cached_at, (int, float)) and not isinstance(cached_at, bool) and now - cached_at < self.__ttl
+
+	def get(self, query: str, tbs: str, total_results: int, backend: str) -> dict[str, typing.Any] | None:
+		"""
+		Get the cached result of the specified Google search.\n
+		Returns `None` if there is no such result, the result has expired, or the cache is being refreshed.
+		"""
+		tmp = None
+		if not self.__refresh:
+			with self.__lock:
+				entry = self.__entries.get(self.__get_key(query, tbs, total_results, backend))
+				if self.__is_fresh(entry, time.time()):
+					tmp = entry.get("result")
+		return tmp
+
+	def set(self, query: str, tbs: str, total_results: int, backend: str, result: dict[str, typing.Any]):
+		"""
+		Cache the result of the specified Google search.\n
+		The cache file is saved after every `config.CACHE_SAVE_EVERY` new results.
+		"""
+		with self.__lock:
+			self.__entries[self.__get_key(query, tbs, total_results, backend)] = {
+				"cached_at"    : time.time(),
+				"query"        : query,
+				"tbs"          : tbs,
+				"total_results": total_results,
+				"backend"      : backend,
+				"result"       : result
+			}
+			self.__unsaved += 1
+			if self.__unsaved >= config.CACHE_SAVE_EVERY:
+				self.__save()
+
+	def save(self):
+		"""
+		Save the cache file if there are any unsaved results.
+		"""
+		with self.__lock:
+			if self.__unsaved:
+				self.__save()
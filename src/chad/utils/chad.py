@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from . import array, file, general, grep, proxy
+from . import array, cache, client, file, general, grep, limiter, proxy
 
-import alive_progress, asyncio, concurrent.futures, dataclasses, datetime, dateutil.relativedelta, nagooglesearch, nagooglesearch_playwright, random, requests, threading, time, urllib3
+import alive_progress, collections, concurrent.futures, dataclasses, datetime, dateutil.relativedelta, math, nagooglesearch, random, requests, threading, time, typing, urllib3
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -33,11 +33,13 @@ class Chad:
 		maximum_queries: int,
 		minimum_pages  : int,
 		maximum_pages  : int,
+		query_budget   : int,
 		playwright     : bool,
 		cookies        : dict[str, str],
 		user_agents    : list[str],
 		proxies        : list[str],
 		sleep_on_start : bool,
+		cache          : cache.Cache | None,
 		debug          : bool
 	):
 		"""
@@ -52,16 +54,28 @@ class Chad:
 		self.__maximum_queries = maximum_queries
 		self.__minimum_pages   = minimum_pages
 		self.__maximum_pages   = maximum_pages
+		self.__query_budget    = query_budget
 		self.__playwright      = playwright
 		self.__cookies         = cookies
 		self.__user_agents     = user_agents
 		self.__user_agents_len = len(self.__user_agents)
-		self.__proxies         = proxy.Proxies(proxies)
+		self.__proxies         = proxy.Proxies(proxies, minimum_queries)
 		self.__sleep_on_start  = sleep_on_start
+		self.__cache           = cache
 		self.__debug           = debug
 		self.__debug_lock      = threading.Lock()
+		self.__print_lock      = threading.Lock()
 		self.__blacklist       = grep.get_blacklist()
 		self.__results         = []
+		self.__found           = {}                  # index -> result of the Google Dork
+		self.__queue           = collections.deque() # indexes of the Google Dorks left to search
+		self.__pending         = 0                   # number of the Google Dorks queued or still being searched
+		self.__waiting         = set()               # proxies waiting for the next Google Dork
+		self.__condition       = threading.Condition()
+		self.__stop            = threading.Event()
+		self.__queries_limiter = limiter.Limiter(minimum_queries, maximum_queries, query_budget)
+		self.__pages_limiter   = limiter.Limiter(minimum_pages, maximum_pages, 1)
+		self.__browser         = None
 
 	def __get_tbs(self, time: int) -> str:
 		"""
@@ -105,105 +119,220 @@ class Chad:
 
 	def run(self):
 		"""
-		Run a Google search.
+		Run a Google search.\n
+		Each proxy, or the direct connection if there are no proxies, searches in its own thread, and, if applicable, its own context of a browser shared for the whole run, with its own rate limits for Google queries and pages, taking the next Google Dork from a shared queue.\n
+		If a proxy fails, it is put on cooldown, and its Google Dork is queued again for the other proxies; healthier and faster proxies take the queued Google Dorks first.\n
+		If applicable, cached Google Dorks are not searched again.
 		"""
 		self.__results = []
+		self.__found   = {}
+		self.__queue   = collections.deque(self.__get_uncached())
+		self.__pending = len(self.__queue)
+		self.__waiting = set()
+		self.__stop    = threading.Event()
+		self.__queries_limiter = limiter.Limiter(self.__minimum_queries, self.__maximum_queries, self.__query_budget)
+		self.__pages_limiter   = limiter.Limiter(self.__minimum_pages, self.__maximum_pages, 1)
+		print(general.get_timestamp("Searching Google Dorks..."))
+		print("Press CTRL + C to exit early - results will be saved")
+		threads = [threading.Thread(target = self.__search, args = (proxy,), daemon = True) for proxy in self.__proxies.get_all() or [""]]
+		self.__browser = client.Browser(headless = True) if self.__playwright else None
 		try:
-			if self.__sleep_on_start:
-				self.__sleep(general.Sleep.START)
-			print(general.get_timestamp("Searching Google Dorks..."))
-			print("Press CTRL + C to exit early - results will be saved")
-			count = 0
-			exit_program = False
-			for query in self.__queries:
-				count += 1
-				result = Google(query)
-				while not exit_program:
-					result.user_agent = self.__get_user_agent()
-					# --------------------
-					if not self.__proxies.is_empty():
-						if self.__proxies.is_round_robin():
-							self.__sleep(general.Sleep.ROUND_ROBIN)
-						result.proxy = self.__proxies.get()
-					elif count > 1:
-						self.__sleep(general.Sleep.BETWEEN)
-					# --------------------
-					self.__print_status(count, result)
-					search_parameters = {
-						"q"     : result.query,
-						"tbs"   : self.__tbs,
-						"hl"    : "en",
-						"udm"   : "14",
-						"sa"    : "N",
-						"filter": "0",
-						"safe"  : "images",
-						"num"   : str(self.__page_results) # deprecated
-					}
-					client_kwargs = {
-						"tld"              : "com",
-						"search_parameters": search_parameters,
-						"cookies"          : self.__cookies,
-						"user_agent"       : result.user_agent,
-						"proxy"            : result.proxy,
-						"max_results"      : self.__total_results,
-						"min_sleep"        : self.__minimum_pages,
-						"max_sleep"        : self.__maximum_pages,
-						"debug"            : self.__debug
-					}
-					if self.__playwright:
-						client_kwargs.update({
-							"headless": True,
-							"humanize": True
-						})
-						client = nagooglesearch_playwright.GoogleClient(**client_kwargs)
-						result.urls = asyncio.run(client.search())
-					else:
-						client = nagooglesearch.GoogleClient(**client_kwargs)
-						result.urls = client.search()
-					# --------------------
-					if not grep.has_site(result.query):
-						result.urls = grep.filter_blacklist(result.urls, self.__blacklist)
-					if result.urls:
-						result.urls = array.unique([url.split("#:~:text=")[0] for url in result.urls])
-						self.__results.append(result)
-					general.print_cyan(f"Links Extracted: {len(result.urls)}")
-					# --------------------
-					if client.get_error() is None:
-						break
-					general.print_red(client.get_error().value)
-					if not result.proxy:
-						exit_program = True
-						break
-					message = self.__proxies.remove(result.proxy)
-					if message:
-						print(message)
-					if self.__proxies.is_empty():
-						general.print_red("All proxies has been exhausted!")
-						exit_program = True
-						break
-					# --------------------
-				if exit_program:
-					break
+			for thread in threads:
+				thread.start()
+			for thread in threads:
+				while thread.is_alive():
+					thread.join(0.5) # keep the main thread responsive to CTRL + C
 		except KeyboardInterrupt:
-			pass
+			self.__stop.set()
+		finally:
+			if self.__browser:
+				self.__browser.close()
+			if self.__cache:
+				self.__cache.save()
+		with self.__condition:
+			self.__results = [self.__found[index] for index in sorted(self.__found)]
 		if not self.__results:
 			print("No results")
 		else:
 			print(general.jdump(self.__to_dict()))
 		return bool(self.__results)
 
-	def __sleep(self, stage: general.Sleep):
+	def __search(self, proxy: str):
+		"""
+		Search Google Dorks from the shared queue through the specified proxy until the queue is empty, the proxy is removed, or the search is stopped.
+		"""
+		if self.__sleep_on_start and self.__has_next():
+			self.__sleep(general.Sleep.START, proxy)
+		while not self.__stop.is_set():
+			index = self.__next(proxy)
+			if index is None:
+				break
+			self.__sleep(general.Sleep.BETWEEN, proxy)
+			if self.__stop.is_set():
+				break
+			result = Google(self.__queries[index], self.__get_user_agent(), proxy)
+			self.__print_status(index + 1, result)
+			google = self.__search_query(result)
+			self.__queries_limiter.release(proxy)
+			self.__print(f"Links Extracted: {len(result.urls)}{f' | QUERY {index + 1}/{len(self.__queries)}' if len(self.__proxies.get_all()) > 1 else ''}", general.print_cyan)
+			if google.get_error() is None:
+				self.__proxies.succeeded(proxy, google.get_latency())
+				if self.__cache:
+					self.__cache.set(result.query, self.__tbs, self.__total_results, self.__get_backend(), dataclasses.asdict(result))
+				self.__done(index, result)
+				continue
+			self.__print(google.get_error().value, general.print_red)
+			self.__done(index, result, requeue = bool(proxy))
+			if not proxy:
+				self.__stop.set()
+				break
+			cooldown, message = self.__proxies.failed(proxy)
+			if cooldown:
+				self.__print(f"Cooling down '{proxy}' for {cooldown} sec due to an error or rate limiting")
+				self.__wait(cooldown)
+				continue
+			if message:
+				self.__print(message)
+			if self.__proxies.is_empty():
+				self.__print("All proxies has been exhausted!", general.print_red)
+				self.__stop.set()
+			break
+
+	def __get_uncached(self):
+		"""
+		Store the cached results of Google Dorks, if any.\n
+		Returns the indexes of the Google Dorks to search.
+		"""
+		tmp = []
+		for index, query in enumerate(self.__queries):
+			cached = self.__cache.get(query, self.__tbs, self.__total_results, self.__get_backend()) if self.__cache else None
+			if cached is None:
+				tmp.append(index)
+			elif cached.get("urls"):
+				self.__found[index] = Google(**cached)
+		if len(tmp) < len(self.__queries):
+			print(general.get_timestamp(f"Number of cached Google Dorks: {len(self.__queries) - len(tmp)}"))
+		return tmp
+
+	def __get_backend(self):
+		"""
+		Get the name of the Google client in use.
+		"""
+		return "playwright" if self.__playwright else "requests"
+
+	def __search_query(self, result: Google):
+		"""
+		Search a single Google Dork, and store the extracted URLs in the result.\n
+		Returns the Google client, so its error, if any, can be checked.
+		"""
+		search_parameters = {
+			"q"     : result.query,
+			"tbs"   : self.__tbs,
+			"hl"    : "en",
+			"udm"   : "14",
+			"sa"    : "N",
+			"filter": "0",
+			"safe"  : "images",
+			"num"   : str(self.__page_results) # deprecated
+		}
+		client_kwargs = {
+			"tld"              : "com",
+			"search_parameters": search_parameters,
+			"cookies"          : self.__cookies,
+			"user_agent"       : result.user_agent,
+			"proxy"            : result.proxy,
+			"max_results"      : self.__total_results,
+			"min_sleep"        : self.__minimum_pages,
+			"max_sleep"        : self.__maximum_pages,
+			"debug"            : self.__debug
+		}
+		self.__stop.wait(self.__pages_limiter.reserve(result.proxy)) # Google homepage
+		if self.__playwright:
+			client_kwargs.update({
+				"headless": True,
+				"humanize": True
+			})
+			google = client.GooglePlaywrightClient(self.__browser, self.__pages_limiter, self.__stop, **client_kwargs)
+			result.urls = self.__browser.run(google.search())
+		else:
+			google = client.GoogleClient(self.__pages_limiter, self.__stop, **client_kwargs)
+			result.urls = google.search()
+		if not grep.has_site(result.query):
+			result.urls = grep.filter_blacklist(result.urls, self.__blacklist)
+		if result.urls:
+			result.urls = array.unique([url.split("#:~:text=")[0] for url in result.urls])
+		return google
+
+	def __has_next(self):
+		"""
+		Returns `True` if any Google Dork is queued or still being searched.
+		"""
+		with self.__condition:
+			return self.__pending > 0
+
+	def __next(self, proxy: str) -> int | None:
+		"""
+		Take the index of the next Google Dork from the shared queue.\n
+		If the queue is empty, wait for the Google Dorks still being searched, as they might be queued again.\n
+		If multiple proxies are waiting, the healthiest and fastest one takes the Google Dork first.\n
+		Returns `None` if there are no Google Dorks left, or if the search is stopped.
+		"""
+		with self.__condition:
+			self.__waiting.add(proxy)
+			while (not self.__queue or not self.__is_preferred(proxy)) and self.__pending > 0 and not self.__stop.is_set():
+				self.__condition.wait(1)
+			self.__waiting.discard(proxy)
+			self.__condition.notify_all()
+			if not self.__queue or self.__stop.is_set():
+				return None
+			return self.__queue.popleft()
+
+	def __is_preferred(self, proxy: str):
+		"""
+		Returns `True` if the specified proxy is the healthiest and fastest of the waiting proxies, or if there are no proxies.
+		"""
+		return not proxy or self.__proxies.get_best(self.__waiting) in [proxy, ""]
+
+	def __done(self, index: int, result: Google, requeue = False):
 		"""
-		Sleep for a random amount of time in seconds.
+		Store the result of a Google Dork, if any, and either mark the Google Dork as searched or queue it again.\n
+		A later result of the same Google Dork replaces the earlier one.
 		"""
-		seconds = random.randint(self.__minimum_queries, self.__maximum_queries)
+		with self.__condition:
+			if result.urls:
+				self.__found[index] = result
+			if requeue:
+				self.__queue.appendleft(index)
+			else:
+				self.__pending -= 1
+			self.__condition.notify_all()
+
+	def __sleep(self, stage: general.Sleep, proxy: str):
+		"""
+		Sleep for a random amount of time in seconds, or until the search is stopped, see `__wait()`.\n
+		Between Google Dorks, sleep only as long as the query rate limiter of the proxy requires.
+		"""
+		seconds = random.randint(self.__minimum_queries, self.__maximum_queries) if stage == general.Sleep.START else math.ceil(self.__queries_limiter.reserve(proxy))
+		if seconds <= 0:
+			return
+		suffix = f" | PROXY: {proxy}" if proxy else ""
 		if stage == general.Sleep.START:
-			print(f"Sleeping on start for {seconds} sec...")
+			self.__print(f"Sleeping on start for {seconds} sec...{suffix}")
 		elif stage == general.Sleep.BETWEEN:
-			print(f"Sleeping between Google Dorks for {seconds} sec...")
-		elif stage == general.Sleep.ROUND_ROBIN:
-			print(f"Sleeping after reaching the round-robin proxy limit for {seconds} sec...")
-		time.sleep(seconds)
+			self.__print(f"Sleeping between Google Dorks for {seconds} sec...{suffix}")
+		self.__wait(seconds)
+
+	def __wait(self, seconds: float):
+		"""
+		Wait for the specified number of seconds, or until the search is stopped, or until no Google Dork is queued or still being searched.
+		"""
+		deadline = time.monotonic() + seconds
+		with self.__condition:
+			while self.__pending > 0 and not self.__stop.is_set():
+				remaining = deadline - time.monotonic()
+				if remaining <= 0:
+					break
+				self.__condition.wait(min(remaining, 1)) # the stop event does not notify the condition
 
 	def __print_status(self, id: int, data: Google):
 		"""
@@ -212,7 +341,14 @@ class Chad:
 		text = f"QUERY {id}/{len(self.__queries)}: {data.query}"
 		if data.proxy:
 			text = f"{text} | PROXY: {data.proxy}"
-		general.print_green(general.get_timestamp(text))
+		self.__print(general.get_timestamp(text), general.print_green)
+
+	def __print(self, message: str, print_function: typing.Callable[[str], None] = print):
+		"""
+		Print a message, one search thread at a time.
+		"""
+		with self.__print_lock:
+			print_function(message)
 
 	def __get_headers(self):
 		"""
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+
+from . import limiter
+
+import asyncio, nagooglesearch, nagooglesearch_playwright, playwright.async_api, requests, threading, time, typing
+
+T = typing.TypeVar("T")
+
+class GoogleClient(nagooglesearch.GoogleClient):
+
+	def __init__(self, pages: limiter.Limiter, stop: threading.Event, **kwargs):
+		"""
+		Class for Google searching, which waits between Google pages only as long as the proxy actually needs to.
+		"""
+		super().__init__(**kwargs)
+		self.__pages = pages
+		self.__stop  = stop
+		self.__key   = kwargs.get("proxy", "")
+		self.__times = []
+
+	def get_latency(self) -> float | None:
+		"""
+		Get the average Google page response time in seconds.\n
+		Returns `None` if no Google page was requested.
+		"""
+		return sum(self.__times) / len(self.__times) if self.__times else None
+
+	def _GoogleClient__get_page(self, session: requests.Session, url: str): # overrides the private method of the base class
+		"""
+		Get a Google page, and measure its response time.
+		"""
+		start = time.monotonic()
+		html = super()._GoogleClient__get_page(session, url)
+		self.__times.append(time.monotonic() - start)
+		return html
+
+	def _GoogleClient__sleep_random(self): # overrides the private method of the base class
+		"""
+		Wait for the page rate limiter of the proxy, or until the search is stopped.
+		"""
+		self.__stop.wait(self.__pages.reserve(self.__key))
+
+class Browser:
+
+	def __init__(self, headless: bool = True):
+		"""
+		Class for sharing a single Playwright's headless browser between multiple threads for the whole run.\n
+		The browser runs on its own event loop in a background thread, and is launched on first use.\n
+		Each proxy gets its own browser context, reused across Google queries, so multiple proxies search concurrently on the same event loop.
+		"""
+		self.__headless   = headless
+		self.__playwright = None
+		self.__browser    = None
+		self.__contexts   = {} # proxy -> browser context
+		self.__lock       = None
+		self.__loop       = asyncio.new_event_loop()
+		self.__thread     = threading.Thread(target = self.__loop.run_forever, daemon = True)
+		self.__thread.start()
+
+	def run(self, coroutine: typing.Coroutine[typing.Any, typing.Any, T]) -> T:
+		"""
+		Run a coroutine on the browser's event loop, and wait for its result.
+		"""
+		return asyncio.run_coroutine_threadsafe(coroutine, self.__loop).result()
+
+	async def get_context(self, proxy: str, kwargs: dict[str, typing.Any]) -> playwright.async_api.BrowserContext:
+		"""
+		Get the browser context of the specified proxy.\n
+		If the context does not exist, or the browser has crashed, create a new one with the specified options.
+		"""
+		if not self.__lock:
+			self.__lock = asyncio.Lock()
+		async with self.__lock:
+			if not self.__browser or not self.__browser.is_connected():
+				self.__contexts = {}
+				if not self.__playwright:
+					self.__playwright = await playwright.async_api.async_playwright().start()
+				self.__browser = await self.__playwright.chromium.launch(
+					headless            = self.__headless,
+					handle_sigint       = False,
+					args                = ["--disable-blink-features=AutomationControlled"],
+					ignore_default_args = ["--enable-automation"]
+				)
+			if proxy not in self.__contexts:
+				self.__contexts[proxy] = await self.__browser.new_context(**kwargs)
+			return self.__contexts[proxy]
+
+	async def discard_context(self, proxy: str):
+		"""
+		Close and forget the browser context of the specified proxy, e.g., after an error, so the next Google query starts clean.
+		"""
+		context = self.__contexts.pop(proxy, None)
+		if context:
+			try:
+				await context.close()
+			except playwright.async_api.Error:
+				pass
+
+	async def __close(self):
+		for proxy in list(self.__contexts):
+			await self.discard_context(proxy)
+		if self.__browser:
+			try:
+				await self.__browser.close()
+			except playwright.async_api.Error:
+				pass
+		if self.__playwright:
+			await self.__playwright.stop()
+
+	def close(self):
+		"""
+		Close the browser, and stop its event loop.
+		"""
+		try:
+			asyncio.run_coroutine_threadsafe(self.__close(), self.__loop).result(30)
+		except Exception:
+			pass
+		self.__loop.call_soon_threadsafe(self.__loop.stop)
+		self.__thread.join(5)
+
+class GooglePlaywrightClient(nagooglesearch_playwright.GoogleClient):
+
+	def __init__(self, browser: Browser, pages: limiter.Limiter, stop: threading.Event, **kwargs):
+		"""
+		Class for Google searching in Playwright's headless browser, which waits between Google pages only as long as the proxy actually needs to.\n
+		The browser and the proxy's browser context are shared across Google queries, see `Browser`; run `search()` with `Browser.run()`.
+		"""
+		super().__init__(**kwargs)
+		self.__browser = browser
+		self.__pages = pages
+		self.__stop  = stop
+		self.__key   = kwargs.get("proxy", "")
+		self.__times = []
+
+	def get_latency(self) -> float | None:
+		"""
+		Get the average Google page response time in seconds.\n
+		Returns `None` if no Google page was requested.
+		"""
+		return sum(self.__times) / len(self.__times) if self.__times else None
+
+	async def _GoogleClient__get_page(self, page: playwright.async_api.Page, url: str): # overrides the private method of the base class
+		"""
+		Get a Google page, and measure its response time.
+		"""
+		start = time.monotonic()
+		html = await super()._GoogleClient__get_page(page, url)
+		self.__times.append(time.monotonic() - start)
+		return html
+
+	async def _GoogleClient__sleep_random(self): # overrides the private method of the base class
+		"""
+		Wait for the page rate limiter of the proxy, or until the search is stopped, without blocking the event loop.\n
+		The stop event is checked every second, so no thread is held while waiting.
+		"""
+		deadline = time.monotonic() + self.__pages.reserve(self.__key)
+		while not self.__stop.is_set():
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				break
+			await asyncio.sleep(min(remaining, 1))
+
+	async def search(self) -> list[str]: # overrides the method of the base class
+		"""
+		Start a Google search in a new page of the proxy's browser context, instead of launching a new browser.\n
+		If the search fails, the browser context is discarded.
+		"""
+		results = set()
+		self._GoogleClient__error = None
+		self._GoogleClient__print_debug("Initial Headers", self._GoogleClient__headers)
+		self._GoogleClient__print_debug("Initial Cookies", {c["name"]: c["value"] for c in self._GoogleClient__cookies})
+		self._GoogleClient__print_debug("Initial Proxy", self._GoogleClient__proxy)
+		page = None
+		try:
+			context = await self.__browser.get_context(self.__key, {
+				"viewport"           : None,
+				"locale"             : "en-US",
+				"timezone_id"        : "Europe/Berlin",
+				"ignore_https_errors": True,
+				"java_script_enabled": True,
+				"accept_downloads"   : False,
+				"bypass_csp"         : False,
+				"proxy"              : {"server": self._GoogleClient__proxy} if self._GoogleClient__proxy else None
+			})
+			await context.set_extra_http_headers(self._GoogleClient__headers) # the user agent can change between Google queries
+			await context.add_cookies(self._GoogleClient__cookies)
+			context.set_default_timeout(30000)
+			page = await context.new_page()
+			await self._GoogleClient__get_browser_fingeprint(page)
+			await self._GoogleClient__get_page(page, self._GoogleClient__urls.homepage)
+			if not self._GoogleClient__error:
+				await self._GoogleClient__click_consent(page)
+				await self._GoogleClient__update_consent_cookie(context)
+				await self._GoogleClient__simulate_typed_search(page)
+				self._GoogleClient__print_debug("Final Cookies", {c["name"]: c["value"] for c in await context.cookies()})
+				while True:
+					await self._GoogleClient__sleep_random()
+					html = await self._GoogleClient__get_page(page, self._GoogleClient__get_paginated_search_url())
+					if self._GoogleClient__error or not html:
+						break
+					found = False
+					for link in self._GoogleClient__extract_links(html):
+						link = self._GoogleClient__validate_link(link)
+						if link:
+							found = True
+							results.add(link)
+					if not found or len(results) >= self._GoogleClient__max_results:
+						break
+				results = sorted(results, key = str.casefold)
+		except asyncio.CancelledError:
+			self._GoogleClient__error = nagooglesearch_playwright.Error.PLAYWRIGHT
+			raise
+		except playwright.async_api.Error as ex: # includes timeouts and closed targets
+			self._GoogleClient__error = nagooglesearch_playwright.Error.PLAYWRIGHT
+			self._GoogleClient__print_debug("Exception", str(ex))
+		finally:
+			if page:
+				try:
+					await page.close()
+				except playwright.async_api.Error:
+					pass
+			if self._GoogleClient__error:
+				await self.__browser.discard_context(self.__key)
+		return list(results)
@@ -14,3 +14,8 @@ def banner():
 	print("# GitHub repository at github.com/ivan-sincek/chad.                     #")
 	print("#                                                                       #")
 	print("#########################################################################")
+
+PROXY_MAX_FAILURES = 5    # consecutive failures before a proxy is removed
+PROXY_MAX_COOLDOWN = 3600 # seconds
+
+CACHE_SAVE_EVERY = 50 # new results before the cache file is saved, it is also saved once the search is done
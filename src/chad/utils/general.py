@@ -8,9 +8,8 @@ class Sleep(enum.Enum):
 	"""
 	Enum containing sleep stages.
 	"""
-	START       = "start"
-	BETWEEN     = "between"
-	ROUND_ROBIN = "round_robin"
+	START   = "start"
+	BETWEEN = "between"
 
 def get_timestamp(message: str):
 	"""
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+import collections, random, threading, time
+
+class Limiter:
+
+	def __init__(self, minimum: int, maximum: int, budget: int):
+		"""
+		Class for rate limiting requests per key, e.g., per proxy, shared between multiple threads.\n
+		Each key can send up to `budget` requests back to back; after that, each request has to wait a random amount of time, between `minimum` and `maximum` seconds, since the request `budget` requests ago.\n
+		Time spent since that request counts toward the wait, so a key waits only as long as it actually needs to.\n
+		If a request takes a while, e.g., a Google query with multiple pages, call `release()` once it is done, so the wait counts from then on.
+		"""
+		self.__minimum = minimum
+		self.__maximum = maximum
+		self.__budget  = budget
+		self.__history = {} # key -> scheduled times of the last requests
+		self.__lock    = threading.Lock()
+
+	def reserve(self, key: str) -> float:
+		"""
+		Reserve the next request for the specified key.\n
+		Returns the number of seconds to wait before sending the request.
+		"""
+		with self.__lock:
+			now     = time.monotonic()
+			history = self.__history.setdefault(key, collections.deque(maxlen = self.__budget))
+			at      = now
+			if len(history) == self.__budget:
+				at = max(now, history[0] + random.randint(self.__minimum, self.__maximum))
+			history.append(at)
+			return at - now
+
+	def release(self, key: str):
+		"""
+		Mark the last reserved request for the specified key as done.
+		"""
+		with self.__lock:
+			history = self.__history.get(key)
+			if history:
+				history[-1] = max(history[-1], time.monotonic())
@@ -1,55 +1,90 @@
 #!/usr/bin/env python3
 
+from . import config
+
+import dataclasses, threading, typing
+
+@dataclasses.dataclass
+class Health:
+	"""
+	Class for storing the health of a proxy.
+	"""
+	successes: int          = 0
+	failures : int          = 0
+	strikes  : int          = 0    # consecutive failures
+	latency  : float | None = None # moving average of Google page response times in seconds
+
+	def get_score(self, default_latency: float):
+		"""
+		Get the score of the proxy, lower is better.\n
+		The latency is weighted by the failure ratio. Proxies without a measured latency are scored with the specified default latency.
+		"""
+		return (self.latency if self.latency is not None else default_latency) * (self.successes + self.failures + 1) / (self.successes + 1)
+
 class Proxies:
 
-	def __init__(self, proxies: list[str]):
+	def __init__(self, proxies: list[str], cooldown: int):
 		"""
-		Class for rotating proxies in a round robin fashion.
+		Class for managing proxies shared between multiple threads.\n
+		A failed proxy is put on cooldown, doubled on each consecutive failure, and removed only after too many consecutive failures.
 		"""
-		self.__proxies     = proxies
-		self.__proxies_len = len(self.__proxies)
-		self.__index       = 0
-		self.__round_robin = False
+		self.__proxies  = proxies
+		self.__health   = {proxy: Health() for proxy in self.__proxies}
+		self.__cooldown = cooldown
+		self.__lock     = threading.Lock()
 
 	def is_empty(self):
 		"""
 		Returns `True` if there are no proxies.
 		"""
-		return not self.__proxies
+		with self.__lock:
+			return not self.__proxies
+
+	def get_all(self):
+		"""
+		Get all the proxies.
+		"""
+		with self.__lock:
+			return list(self.__proxies)
 
-	def is_round_robin(self):
+	def get_best(self, proxies: typing.Iterable[str]):
 		"""
-		This should be checked on each iteration.\n
-		If a full round has been completed, return `True` and reset the round robin flag; otherwise, return `False`.
+		Get the healthiest and fastest of the specified proxies.\n
+		Proxies without a measured latency are scored with the average latency of all the proxies, or one second if there is none.\n
+		Returns an empty string if none of the proxies exist.
 		"""
-		current = self.__round_robin
-		if current:
-			self.__round_robin = False
-		return current
+		with self.__lock:
+			latencies = [health.latency for health in self.__health.values() if health.latency is not None]
+			average   = sum(latencies) / len(latencies) if latencies else 1.0
+			return min((proxy for proxy in proxies if proxy in self.__health), key = lambda proxy: self.__health[proxy].get_score(average), default = "")
 
-	def get(self):
+	def succeeded(self, proxy: str, latency: float | None):
 		"""
-		Get a proxy in a round robin fashion.\n
-		If a full round has been completed, set the round robin flag.\n
-		Returns an empty string if there are no proxies.
+		Record a successful Google query, and its average Google page response time in seconds, if any.
 		"""
-		proxy = ""
-		if self.__proxies:
-			proxy = self.__proxies[self.__index]
-			self.__index = (self.__index + 1) % self.__proxies_len
-			if self.__index == 0:
-				self.__round_robin = True
-		return proxy
+		with self.__lock:
+			if proxy in self.__health:
+				health = self.__health[proxy]
+				health.successes += 1
+				health.strikes = 0
+				if latency is not None:
+					health.latency = latency if health.latency is None else 0.7 * health.latency + 0.3 * latency
 
-	def remove(self, proxy: str):
+	def failed(self, proxy: str):
 		"""
-		Remove a proxy.\n
-		Returns an empty message if the proxy does not exist.
+		Record a failed Google query.\n
+		Returns the cooldown in seconds, or zero and a message if the proxy has been removed.
 		"""
-		message = ""
-		if proxy in self.__proxies:
-			self.__proxies.pop(self.__proxies.index(proxy))
-			self.__proxies_len -= 1
-			message = f"Removing '{proxy}' due to an error or rate limiting | Proxies left: {self.__proxies_len}"
-			self.__index = max(0, self.__index - 1)
-		return message
+		cooldown, message = 0, ""
+		with self.__lock:
+			if proxy in self.__health:
+				health = self.__health[proxy]
+				health.failures += 1
+				health.strikes += 1
+				if health.strikes < config.PROXY_MAX_FAILURES:
+					cooldown = min(self.__cooldown * 2 ** (health.strikes - 1), config.PROXY_MAX_COOLDOWN)
+				else:
+					self.__proxies.pop(self.__proxies.index(proxy))
+					self.__health.pop(proxy)
+					message = f"Removing '{proxy}' after {health.strikes} consecutive errors or rate limits | Proxies left: {len(self.__proxies)}"
+		return cooldown, message
@@ -47,8 +47,14 @@ class MyArgParser(argparse.ArgumentParser):
 		print("    Maximum sleep time between Google pages")
 		print("    Default: minimum + 15")
 		print("    -max-p, --maximum-pages = 60 | etc.")
+		print("QUERY BUDGET")
+		print("    Number of Google queries each proxy can send back to back before the sleep between Google queries applies")
+		print("    Time since the proxy's last Google query finished counts toward the sleep")
+		print("    Default: 1")
+		print("    -qb, --query-budget = 3 | etc.")
 		print("PLAYWRIGHT")
 		print("    Use Playwright's headless browser")
+		print("    The browser is launched once per run, with one browser context per proxy")
 		print("    -p, --playwright")
 		print("COOKIE")
 		print("    Specify any number of extra HTTP cookies")
@@ -60,6 +66,9 @@ class MyArgParser(argparse.ArgumentParser):
 		print("    -a, --user-agents = user_agents.txt | random[-all] | curl/3.30.1 | etc.")
 		print("PROXIES")
 		print("    File containing web proxies or a single web proxy to use")
+		print("    Each proxy searches in parallel, with its own sleep between Google queries")
+		print("    If a proxy fails, it is put on cooldown, doubled on each consecutive failure, and its Google Dork is searched again by the other proxies")
+		print("    Healthier and faster proxies are preferred, and a proxy is removed after 5 consecutive failures")
 		print("    -x, --proxies = proxies.txt | http://127.0.0.1:8080 | etc.")
 		print("DIRECTORY")
 		print("    Downloads directory")
@@ -73,6 +82,17 @@ class MyArgParser(argparse.ArgumentParser):
 		print("OUT")
 		print("    Output file")
 		print("    -o, --out = results.json | etc.")
+		print("CACHE")
+		print("    JSON file for caching the results of Google Dorks")
+		print("    Cached Google Dorks are not searched again")
+		print("    -c, --cache = cache.json | etc.")
+		print("CACHE TTL")
+		print("    Time in hours after which cached results expire")
+		print("    Default: 24")
+		print("    -ct, --cache-ttl = 168 | etc.")
+		print("REFRESH")
+		print("    Search cached Google Dorks again, and update the cache")
+		print("    -r, --refresh")
 		print("NO SLEEP ON START")
 		print("    Disable the safety feature to prevent triggering rate limits by accident")
 		print("    -nsos, --no-sleep-on-start")
@@ -82,7 +102,7 @@ class MyArgParser(argparse.ArgumentParser):
 
 	def error(self, message):
 		if len(sys.argv) > 1:
-			print("Missing a mandatory option (-q) and/or optional (-s, -t, -tr, -pr, -min-q, -max-q, -min-p, -max-p, -p, -b, -a, -x, -dir, -th, -o, -nsos, -dbg)")
+			print("Missing a mandatory option (-q) and/or optional (-s, -t, -tr, -pr, -min-q, -max-q, -min-p, -max-p, -qb, -p, -b, -a, -x, -dir, -th, -o, -c, -ct, -r, -nsos, -dbg)")
 			print("Use -h or --help for more info")
 		else:
 			self.print_help()
@@ -104,6 +124,7 @@ class Validate:
 		self.__parser.add_argument("-max-q", "--maximum-queries"  , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-min-p", "--minimum-pages"    , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-max-p", "--maximum-pages"    , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-qb"   , "--query-budget"     , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-p"    , "--playwright"       , required = False, action = "store_true", default = False)
 		self.__parser.add_argument("-b"    , "--cookie"           , required = False, action = "append"    , nargs   = "+"  )
 		self.__parser.add_argument("-a"    , "--user-agents"      , required = False, type   = str         , default = ""   )
@@ -111,6 +132,9 @@ class Validate:
 		self.__parser.add_argument("-dir"  , "--directory"        , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-th"   , "--threads"          , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-o"    , "--out"              , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-c"    , "--cache"            , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-ct"   , "--cache-ttl"        , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-r"    , "--refresh"          , required = False, action = "store_true", default = False)
 		self.__parser.add_argument("-nsos" , "--no-sleep-on-start", required = False, action = "store_true", default = False)
 		self.__parser.add_argument("-dbg"  , "--debug"            , required = False, action = "store_true", default = False)
 
@@ -128,11 +152,14 @@ class Validate:
 		self.__validate_maximum_queries()
 		self.__validate_minimum_pages()
 		self.__validate_maximum_pages()
+		self.__validate_query_budget()
 		self.__validate_cookie()
 		self.__validate_user_agents()
 		self.__validate_proxies()
 		self.__validate_directory()
 		self.__validate_threads()
+		self.__validate_cache()
+		self.__validate_cache_ttl()
 		return self.__success, self.__args
 
 	def __error(self, message: str):
@@ -235,6 +262,17 @@ class Validate:
 					self.__error("Maximum sleep time between Google pages must be greater than zero")
 		self.__args.maximum_pages = tmp
 
+	def __validate_query_budget(self):
+		tmp = 1
+		if self.__args.query_budget:
+			if not self.__args.query_budget.isdigit():
+				self.__error("Number of Google queries sent back to back must be numeric")
+			else:
+				tmp = int(self.__args.query_budget)
+				if tmp <= 0:
+					self.__error("Number of Google queries sent back to back must be greater than zero")
+		self.__args.query_budget = tmp
+
 	def __validate_cookie(self):
 		tmp = {}
 		if self.__args.cookie:
@@ -297,3 +335,19 @@ class Validate:
 				if tmp <= 0:
 					self.__error("Number of files to download in parallel must be greater than zero")
 		self.__args.threads = tmp
+
+	def __validate_cache(self):
+		if self.__args.cache:
+			if directory.is_directory(self.__args.cache):
+				self.__error(f"\"{self.__args.cache}\" is a directory")
+
+	def __validate_cache_ttl(self):
+		tmp = 24
+		if self.__args.cache_ttl:
+			if not self.__args.cache_ttl.isdigit():
+				self.__error("Cache expiration time must be numeric")
+			else:
+				tmp = int(self.__args.cache_ttl)
+				if tmp <= 0:
+					self.__error("Cache expiration time must be greater than zero")
+		self.__args.cache_ttl = tmp
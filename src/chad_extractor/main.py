@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from .utils import config, extractor, report, result, storage, validate
+from .utils import config, extractor, journal, plaintext, report, result, storage, validate
 
 import datetime
 
@@ -30,7 +30,8 @@ def main():
 	success, args = validate.Validate().validate_args()
 	if success:
 		config.banner()
-		results = None
+		results    = None
+		checkpoint = journal.Journal(args.out.rsplit(".", 1)[0] + config.JOURNAL_EXTENSION, args.resume)
 		storage.MyManager.register("Shared", storage.Shared)
 		with storage.MyManager() as manager:
 			shared_storage: storage.Shared = manager.Shared(
@@ -38,12 +39,19 @@ def main():
 				args.results,
 				args.plaintext,
 				args.excludes,
+				checkpoint,
+				report.Live(args.out_live, args.resume) if args.out_live else None,
 				args.debug
 			)
 			tool = extractor.ChadExtractor(
 				shared_storage,
 				args.playwright,
+				args.playwright_auto,
+				args.playwright_markers,
 				args.playwright_wait,
+				args.playwright_wait_until,
+				args.playwright_contexts,
+				args.playwright_pages,
 				args.concurrent_requests,
 				args.concurrent_requests_domain,
 				args.sleep,
@@ -53,12 +61,26 @@ def main():
 				args.request_timeout,
 				args.user_agents,
 				args.proxy,
+				args.workers,
+				args.processes,
 				args.debug
 			)
 			if not shared_storage.parse_template():
 				print("No extraction details were found in the template")
-			elif not shared_storage.parse_input():
+			elif not (plaintext.Engine(shared_storage, args.results, args.chunk_size, args.chunk_overlap, args.offsets, args.workers, args.debug).run() if args.plaintext else shared_storage.parse_input()):
 				print("No data was extracted" if args.plaintext else "No Chad results are suitable for extraction")
+			elif args.pipeline:
+				validation = shared_storage.start_pipeline()
+				success = tool.run()
+				shared_storage.finish_pipeline()
+				if not success:
+					print("No data was extracted")
+				elif not validation:
+					print("No validation details were found in the template")
+				elif not shared_storage.has_input():
+					print("No extracted data is suitable for validation")
+				elif not shared_storage.has_success():
+					print("No extracted data matched the validation criteria")
 			elif not args.plaintext and not tool.run():
 				print("No data was extracted")
 			else:
@@ -71,8 +93,9 @@ def main():
 					print("No extracted data matched the validation criteria")
 			results = shared_storage.get_results()
 		stopwatch.stop()
+		saved = False
 		if results.results[result.Stage.EXTRACTION].success:
-			report.save(
+			saved = report.save(
 				results,
 				stopwatch.get_start(),
 				stopwatch.get_end(),
@@ -80,6 +103,8 @@ def main():
 				args.verbose,
 				args.plaintext
 			)
+		if not tool.is_interrupted() and (saved or not results.results[result.Stage.EXTRACTION].success): # the run is complete, nothing to resume
+			checkpoint.remove()
 
 if __name__ == "__main__":
 	main()
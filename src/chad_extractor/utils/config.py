@@ -4,6 +4,10 @@ APP_VERSION = "v7.6"
 
 REPORT_EXTENSION = ".report.json"
 
+JOURNAL_EXTENSION = ".journal.jsonl"
+
+INPUT_PAGE_SIZE = 1000 # number of input entries a crawler process fetches from the shared storage at once
+
 def banner():
 	"""
 	Display the banner.
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+from playwright.async_api import BrowserContext
+
+import dataclasses
+
+@dataclasses.dataclass
+class Context:
+	"""
+	Class for storing a Playwright's browser context bookkeeping.
+	"""
+	name    : str
+	profile : str
+	assigned: int                   = 0
+	active  : int                   = 0
+	retired : bool                  = False
+	handle  : BrowserContext | None = None
+
+class Pool:
+
+	def __init__(self, max_contexts: int, max_pages: int):
+		"""
+		Class for managing a bounded pool of reusable Playwright's browser contexts.\n
+		Requests with the same profile, i.e., the same proxy, headers, and cookies, share a live context.\n
+		A context is retired after it was assigned the maximum number of pages or after an error, and it is closed only once all its pages are done.\n
+		Once the maximum number of live contexts is reached, the least recently used one is retired.\n
+		The maximum is a soft limit, retired contexts stay open while their pages are done, as Scrapy's requests cannot wait for them to drain.
+		"""
+		self.__max_contexts = max_contexts
+		self.__max_pages    = max_pages
+		self.__contexts     = {} # name -> context
+		self.__live         = {} # profile -> name, from the least to the most recently used
+		self.__closing      = [] # drained contexts to be closed
+		self.__counter      = 0
+
+	def acquire(self, profile: str):
+		"""
+		Get the name of a live context for the specified profile, and assign a page to it.
+		"""
+		name = self.__live.pop(profile, None)
+		if name and self.__contexts[name].assigned >= self.__max_pages:
+			self.__retire(name)
+			name = None
+		if not name:
+			if len(self.__live) >= self.__max_contexts:
+				self.__retire(next(iter(self.__live.values())))
+			self.__counter += 1
+			name = str(self.__counter)
+			self.__contexts[name] = Context(name, profile)
+		self.__live[profile] = name
+		context = self.__contexts[name]
+		context.assigned += 1
+		context.active += 1
+		return name
+
+	def release(self, name: str, handle: BrowserContext | None, error: bool) -> list[BrowserContext]:
+		"""
+		Release a page of the specified context, and retire the context on error.\n
+		Returns all the drained contexts which have to be closed.
+		"""
+		context = self.__contexts.get(name)
+		if context:
+			if handle:
+				context.handle = handle
+			context.active -= 1
+			if error:
+				self.__retire(name)
+			else:
+				self.__close_if_drained(name)
+		tmp, self.__closing = self.__closing, []
+		return tmp
+
+	def __retire(self, name: str):
+		"""
+		Stop assigning pages to the specified context.
+		"""
+		context = self.__contexts[name]
+		context.retired = True
+		if self.__live.get(context.profile) == name:
+			self.__live.pop(context.profile)
+		self.__close_if_drained(name)
+
+	def __close_if_drained(self, name: str):
+		"""
+		Queue the specified context to be closed if it is retired and all its pages are done.
+		"""
+		context = self.__contexts[name]
+		if context.retired and context.active <= 0:
+			self.__contexts.pop(name)
+			if context.handle:
+				self.__closing.append(context.handle)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import regex as re
+
+class Escalation:
+
+	def __init__(self, markers: list[str]):
+		"""
+		Class for deciding if a page fetched over plain HTTP has to be rendered in Playwright's headless browser.\n
+		A page is escalated if no data was extracted from it, if it is a JavaScript shell, or if any of the markers is found in it.
+		"""
+		self.__flags        = re.MULTILINE | re.IGNORECASE
+		self.__markers      = re.compile(f"(?|{('|').join(f'(?:{query})' for query in markers)})", flags = self.__flags) if markers else None
+		self.__shell        = re.compile(r"<noscript\b[^>]*>[^<]*\b(?:enable|requires?|turn\s+on)\b[^<]*\bjavascript\b|<div\s+id\s*=\s*[\"']?(?:root|app|__next|__nuxt|svelte)[\"']?\s*>\s*<\/div>", flags = self.__flags)
+		self.__script       = re.compile(r"<script\b", flags = self.__flags)
+		self.__tags         = re.compile(r"<(script|style|template)\b.*?<\/\1\s*>|<!--.*?-->|<[^>]*>", flags = self.__flags | re.DOTALL)
+		self.__min_text_len = 256 # visible characters
+
+	def get_reason(self, content: str, results: dict[str, list[str]]):
+		"""
+		Get the reason for rendering the page in Playwright's headless browser.\n
+		Returns an empty string if the page does not have to be rendered.
+		"""
+		reason = ""
+		if not results:
+			reason = "no matches"
+		elif self.__is_shell(content):
+			reason = "JavaScript shell"
+		elif self.__markers and self.__markers.search(content):
+			reason = "marker"
+		return reason
+
+	def __is_shell(self, content: str):
+		"""
+		Check if the page is a JavaScript shell, i.e. it asks for JavaScript, has an empty mount point, or has almost no visible text but has scripts.
+		"""
+		if self.__shell.search(content):
+			return True
+		elif not self.__script.search(content):
+			return False
+		length = 0
+		last   = 0
+		for match in self.__tags.finditer(content):
+			length += len(content[last:match.start()].strip())
+			if length >= self.__min_text_len:
+				return False
+			last = match.end()
+		length += len(content[last:].strip())
+		return length < self.__min_text_len
@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 
-from . import general, input, result, storage, url
+from . import config, context, escalation, general, input, jquery, matcher, result, storage, url, wait, worker
 
 from twisted.python.failure             import Failure
 from scrapy.spidermiddlewares.httperror import HttpError
 from scrapy.http                        import Request, HtmlResponse
 from playwright.async_api               import Request as PlaywrightRequest, Page as PlaywrightPage, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
-import asyncio, multiprocessing, random, scrapy, scrapy.crawler, scrapy.utils.project, typing
+import multiprocessing, random, scrapy, scrapy.crawler, scrapy.exceptions, scrapy.signals, scrapy.utils.project, typing
 
 # ----------------------------------------
 
@@ -17,48 +17,103 @@ class ChadExtractorSpider(scrapy.Spider):
 
 	def __init__(
 		self,
-		shared_storage : storage.Shared,
-		playwright     : bool,
-		playwright_wait: float,
-		request_timeout: float,
-		user_agents    : list[str],
-		proxy          : str,
-		debug          : bool
+		shared_storage    : storage.Shared,
+		playwright        : bool,
+		playwright_auto   : bool,
+		playwright_markers: list[str],
+		playwright_wait   : float,
+		playwright_until  : str,
+		contexts          : context.Pool,
+		request_timeout   : float,
+		user_agents       : list[str],
+		proxy             : str,
+		workers           : int,
+		shard             : int,
+		shards            : int,
+		debug             : bool
 	):
 		"""
-		Class for managing Scrapy's spider.
+		Class for managing Scrapy's spider.\n
+		If the input is split into shards, the spider crawls only the input of the specified shard.
 		"""
 		self.name                   = "ChadExtractorSpider"
 		self.handle_httpstatus_list = [401, 403, 404]
 		self.__shared_storage       = shared_storage
-		self.__validation_started   = self.__shared_storage.is_validation_started()
+		self.__stage                = result.Stage.VALIDATION if self.__shared_storage.is_validation_started() else result.Stage.EXTRACTION
+		self.__pipeline             = self.__shared_storage.is_pipeline_started()
+		self.__matchers             = self.__get_matchers()
+		self.__snapshot             = self.__shared_storage.get_snapshot()
 		self.__playwright           = playwright
+		self.__escalation           = escalation.Escalation(playwright_markers) if playwright_auto and self.__stage == result.Stage.EXTRACTION else None
+		self.__escalated            = 0
+		self.__queued               = set()
 		self.__playwright_wait      = playwright_wait
+		self.__playwright_until     = playwright_until
+		self.__contexts             = contexts
 		self.__request_timeout      = request_timeout
 		self.__user_agents          = user_agents
 		self.__user_agents_len      = len(self.__user_agents)
 		self.__proxy                = proxy
+		self.__pool                 = worker.Pool(self.__matchers, workers) if workers > 0 else None
+		self.__shard                = shard
+		self.__shards               = shards
 		self.__debug                = debug
 		self.__context              = 0
 
+	def __get_matchers(self) -> dict[result.Stage, matcher.Matcher]:
+		"""
+		Get the matcher for the current stage, and in the pipeline mode, the matcher for validation as well.
+		"""
+		tmp = {self.__stage: self.__shared_storage.get_matcher(self.__stage)}
+		if self.__pipeline:
+			tmp[result.Stage.VALIDATION] = self.__shared_storage.get_matcher(result.Stage.VALIDATION)
+		return tmp
+
+	def closed(self, reason: str):
+		"""
+		Shut down the worker pool, if any, and print the number of escalated and queued URLs, once the spider is closed.
+		"""
+		if self.__pool:
+			self.__pool.close()
+		if self.__escalation:
+			print(general.get_timestamp(f"Number of URLs rendered in Playwright's headless browser: {self.__escalated}"))
+		if self.__pipeline:
+			print(general.get_timestamp(f"Number of URLs queued for validation: {len(self.__queued)}"))
+
 	def start_requests(self):
 		"""
 		Main method.
 		"""
-		input = self.__shared_storage.get_input()
-		print(general.get_timestamp(f"Number of URLs to {'validate' if self.__validation_started else 'extract'}: {len(input)}"))
-		print("Press CTRL + C to exit early - results will be saved, be patient")
-		random.shuffle(input)
-		for entry in input:
-			yield scrapy.Request(
-				url         = entry.url,
-				headers     = self.__get_default_headers() | self.__shared_storage.get_headers(entry.key, with_cookies = False),
-				cookies     = self.__shared_storage.get_cookies(entry.key),
-				meta        = self.__get_metadata(entry),
-				errback     = self.__error,
-				callback    = self.__success,
-				dont_filter = False
-			)
+		if self.__pipeline:
+			self.crawler.signals.connect(self.__idle, signal = scrapy.signals.spider_idle)
+		split = self.__shared_storage.get_input_split(self.__shard) # a URL can be validated both with and without the browser
+		if self.__pipeline:
+			for entry in self.__shared_storage.pop_validation(self.__shard): # journaled extracted data
+				self.__queued.add(entry.url)
+				yield self.__get_request(entry, result.Stage.VALIDATION, dont_filter = True)
+		print(general.get_timestamp(f"Number of URLs to {'validate' if self.__stage == result.Stage.VALIDATION else 'extract'}{f' in process {self.__shard + 1}/{self.__shards}' if self.__shards > 1 else ''}: {self.__shared_storage.get_input_count(self.__shard)}"))
+		if self.__shard == 0:
+			print("Press CTRL + C to exit early - results will be saved, be patient")
+		page = 0
+		while input := self.__shared_storage.get_input_page(self.__shard, page, config.INPUT_PAGE_SIZE): # Scrapy consumes start requests lazily, so pages are fetched on demand
+			for entry in input:
+				yield self.__get_request(entry, self.__stage, dont_filter = entry.url in split)
+			page += 1
+
+	def __get_request(self, entry: input.InputGrouped, stage: result.Stage, dont_filter: bool, results: dict[str, list[str]] | None = None):
+		"""
+		Get Scrapy's request.
+		"""
+		settings = self.__snapshot.get(entry.keys)
+		return scrapy.Request(
+			url         = entry.url,
+			headers     = self.__get_default_headers() | settings.headers,
+			cookies     = dict(settings.cookies),
+			meta        = self.__get_metadata(entry, stage, results),
+			errback     = self.__error,
+			callback    = self.__success,
+			dont_filter = dont_filter
+		)
 
 	def __get_default_headers(self) -> dict[str, str]:
 		"""
@@ -87,21 +142,29 @@ class ChadExtractorSpider(scrapy.Spider):
 			user_agent = self.__user_agents[random.randint(0, self.__user_agents_len - 1)]
 		return user_agent
 
-	def __get_metadata(self, entry: input.InputGrouped) -> dict[str, typing.Any]:
+	def __get_metadata(self, entry: input.InputGrouped, stage: result.Stage, results: dict[str, list[str]] | None = None) -> dict[str, typing.Any]:
 		"""
-		Get Scrapy's request metadata.
+		Get Scrapy's request metadata.\n
+		If the results fetched over plain HTTP are specified, the request is escalated to Playwright's headless browser.
 		"""
 		# --------------------------------
-		if self.__validation_started:
-			self.__playwright, self.__playwright_wait = self.__shared_storage.get_playwright(entry.key)
+		settings = self.__snapshot.get(entry.keys)
+		playwright, playwright_wait, playwright_until = self.__playwright, self.__playwright_wait, self.__playwright_until
+		if stage == result.Stage.VALIDATION:
+			playwright, playwright_wait, playwright_until = settings.playwright, settings.playwright_wait, settings.playwright_wait_until
+		playwright = playwright or results is not None
+		profile    = general.jdump([self.__proxy, settings.headers_with_cookies]) # identical proxy, headers, and cookies
 		# --------------------------------
 		self.__context += 1
 		tmp                                = {}
-		tmp["entry"                      ] = entry                  # custom attribute
-		tmp["playwright_wait"            ] = self.__playwright_wait # custom attribute
-		tmp["playwright"                 ] = self.__playwright
-		tmp["playwright_context"         ] = str(self.__context)
-		tmp["playwright_include_page"    ] = self.__playwright
+		tmp["entry"                      ] = entry            # custom attribute
+		tmp["stage"                      ] = stage            # custom attribute
+		tmp["results"                    ] = results          # custom attribute
+		tmp["playwright_wait"            ] = playwright_wait  # custom attribute
+		tmp["playwright_wait_until"      ] = playwright_until # custom attribute
+		tmp["playwright"                 ] = playwright
+		tmp["playwright_context"         ] = self.__contexts.acquire(profile) if playwright else ""
+		tmp["playwright_include_page"    ] = playwright
 		tmp["playwright_context_kwargs"  ] = {}
 		tmp["playwright_context_kwargs"  ]["ignore_https_errors"] = True
 		tmp["playwright_context_kwargs"  ]["java_script_enabled"] = True
@@ -122,20 +185,35 @@ class ChadExtractorSpider(scrapy.Spider):
 		request   : Request            = failure.request
 		response  : HtmlResponse       = failure.value.response
 		entry     : input.InputGrouped = request.meta["entry"     ]
+		stage     : result.Stage       = request.meta["stage"     ]
 		playwright: bool               = request.meta["playwright"]
+		results   : dict | None        = request.meta["results"   ]
 		status = response.status if failure.check(HttpError) else STATUS_ERROR
 		error  = str(failure.value).splitlines()[0]
 		if playwright:
-			page: PlaywrightPage = request.meta["playwright_page"]
-			if any(err in error for err in ["net::ERR_ABORTED", "net::ERR_CONNECTION_RESET"]):
+			page: PlaywrightPage = request.meta.get("playwright_page")
+			if page and any(err in error for err in ["net::ERR_ABORTED", "net::ERR_CONNECTION_RESET"]):
 				self.__print_fallback(playwright, status, entry.url)
 				content, status, error = await self.__playwright_fallback(page, entry)
-			await page.close()
-			await page.context.close()
-		if error:
-			self.__append_error(entry, playwright, status, error)
+			await self.__close_page(request, page, error = True)
+		if error and results:
+			self.__print_error(playwright, status, entry.url, error)
+			self.__append_results(entry, stage, playwright, status, results) # keep the results fetched over plain HTTP
+		elif error:
+			self.__append_error(entry, stage, playwright, status, error)
 		else:
-			self.__append_success(entry, playwright, status, content)
+			await self.__append_success(entry, stage, playwright, status, content, results)
+
+	async def __close_page(self, request: Request, page: PlaywrightPage | None, error: bool):
+		"""
+		Close Playwright's page, and close its browser context only once the context is retired and drained.
+		"""
+		handle = None
+		if page:
+			handle = page.context
+			await page.close()
+		for retired in self.__contexts.release(request.meta["playwright_context"], handle, error):
+			await retired.close()
 
 	async def __playwright_fallback(self, page: PlaywrightPage, entry: input.InputGrouped) -> tuple[str, int, str]:
 		"""
@@ -148,7 +226,7 @@ class ChadExtractorSpider(scrapy.Spider):
 		try:
 			response = await page.request.get(
 				url                 = entry.url,
-				headers             = self.__get_default_headers() | self.__shared_storage.get_headers(entry.key, with_cookies = True),
+				headers             = self.__get_default_headers() | self.__snapshot.get(entry.keys).headers_with_cookies,
 				ignore_https_errors = True,
 				timeout             = self.__request_timeout * 1000,
 				max_retries         = 0,
@@ -163,12 +241,12 @@ class ChadExtractorSpider(scrapy.Spider):
 				await response.dispose()
 		return content, status, error
 
-	def __append_error(self, entry: input.InputGrouped, playwright: bool, status: int, error: str):
+	def __append_error(self, entry: input.InputGrouped, stage: result.Stage, playwright: bool, status: int, error: str):
 		"""
 		Append the result to the error list and print an error message.
 		"""
 		res = result.Result(entry.url, entry.files)
-		self.__shared_storage.append_error(res)
+		self.__shared_storage.append_error(res, stage, entry.keys)
 		self.__print_error(playwright, status, entry.url, error)
 
 	# ------------------------------------
@@ -178,40 +256,106 @@ class ChadExtractorSpider(scrapy.Spider):
 		Success callback.
 		"""
 		entry     : input.InputGrouped = response.request.meta["entry"     ]
+		stage     : result.Stage       = response.request.meta["stage"     ]
 		playwright: bool               = response.request.meta["playwright"]
+		results   : dict | None        = response.request.meta["results"   ]
 		content = ""
 		error   = ""
 		if playwright:
 			page: PlaywrightPage = response.request.meta["playwright_page"]
 			playwright_wait      = response.request.meta["playwright_wait"]
-			if playwright_wait > 0:
-				await asyncio.sleep(playwright_wait)
-			content = await page.content()
-			await page.close()
-			await page.context.close()
+			playwright_until     = response.request.meta["playwright_wait_until"]
+			if playwright_until and playwright_wait <= 0:
+				playwright_wait = self.__request_timeout
+			async def is_ready(content: str):
+				return bool(await self.__parse_response(content, entry.keys, stage))
+			content = await wait.until(page, playwright_until, playwright_wait, is_ready)
+			await self.__close_page(response.request, page, error = False)
 		elif hasattr(response, "text"):
 			content = response.text
 		else:
 			content, error = general.decode(response.body)
 		if url.normalize(entry.url) != response.url:
 			self.__print_redirected(playwright, response.status, entry.url, response.url)
-		if error:
-			self.__append_error(entry, playwright, response.status, error)
+		if error and results:
+			self.__print_error(playwright, response.status, entry.url, error)
+			self.__append_results(entry, stage, playwright, response.status, results) # keep the results fetched over plain HTTP
+		elif error:
+			self.__append_error(entry, stage, playwright, response.status, error)
 		else:
-			self.__append_success(entry, playwright, response.status, content)
+			await self.__append_success(entry, stage, playwright, response.status, content, results)
 
-	def __append_success(self, entry: input.InputGrouped, playwright: bool, status: int, content: str):
+	async def __append_success(self, entry: input.InputGrouped, stage: result.Stage, playwright: bool, status: int, content: str, previous: dict[str, list[str]] | None = None):
+		"""
+		Append the result to the success list and print a success message.\n
+		If required, escalate the URL to Playwright's headless browser instead.\n
+		Results fetched over plain HTTP, if any, are merged with the results fetched in the browser.
+		"""
+		results = await self.__parse_response(content, entry.keys, stage)
+		if stage == result.Stage.VALIDATION:
+			results = {key: [entry.url] for key in results} # validated keys
+		elif previous:
+			results = jquery.merge_results(previous, results)
+		if self.__escalation and stage == result.Stage.EXTRACTION and not playwright:
+			reason = self.__escalation.get_reason(content, results)
+			if reason:
+				self.__escalate(entry, status, results, reason)
+				return
+		self.__append_results(entry, stage, playwright, status, results)
+
+	async def __parse_response(self, content: str, keys: list[str], stage: result.Stage) -> dict[str, list[str]] | list[str]:
 		"""
-		Append the result to the success list and print a success message.
+		Parse an HTTP response content in the worker pool, if any, or in the crawler process.
 		"""
-		res = result.Result(entry.url, entry.files)
-		res.results = self.__shared_storage.parse_response(content, entry.key)
+		return await self.__pool.parse_response(content, keys, stage) if self.__pool else self.__matchers[stage].parse_response(content, keys)
+
+	def __append_results(self, entry: input.InputGrouped, stage: result.Stage, playwright: bool, status: int, results: dict[str, list[str]]):
+		"""
+		Append the results to the success list and print a success message.\n
+		In the pipeline mode, queue the extracted data for validation.
+		"""
+		res = result.Result(entry.url, entry.files, results)
 		if res.results:
-			self.__shared_storage.append_success(res)
-			self.__print_success(playwright, status, entry.url)
+			self.__shared_storage.append_success(res, stage, entry.keys)
+			self.__print_success(stage, playwright, status, entry.url)
+			if self.__pipeline and stage == result.Stage.EXTRACTION:
+				self.__queue_validation(res)
 		else:
+			self.__shared_storage.append_no_results(res, stage, entry.keys)
 			self.__print_success_no_results(playwright, status, entry.url)
 
+	def __escalate(self, entry: input.InputGrouped, status: int, results: dict[str, list[str]], reason: str):
+		"""
+		Re-queue the URL to be fetched in Playwright's headless browser.
+		"""
+		self.__escalated += 1
+		self.__print_escalated(status, entry.url, reason)
+		self.crawler.engine.crawl(self.__get_request(entry, result.Stage.EXTRACTION, dont_filter = True, results = results))
+
+	def __queue_validation(self, res: result.Result):
+		"""
+		Queue the extracted data for validation in the same crawl.\n
+		Each URL is queued at most once per key.
+		"""
+		for entry in self.__shared_storage.queue_validation(res, self.__shard):
+			self.__queued.add(entry.url)
+			self.crawler.engine.crawl(self.__get_request(entry, result.Stage.VALIDATION, dont_filter = True))
+
+	def __idle(self):
+		"""
+		In the pipeline mode, once idle, the extraction of this shard is finished.\n
+		Keep validating the data queued by other shards until the extraction of all shards is finished.\n
+		The finished flag is read before popping, so the data queued by a shard right before it finished is never missed.
+		"""
+		self.__shared_storage.finish_extraction(self.__shard)
+		finished = self.__shared_storage.is_extraction_finished()
+		input    = self.__shared_storage.pop_validation(self.__shard)
+		for entry in input:
+			self.__queued.add(entry.url)
+			self.crawler.engine.crawl(self.__get_request(entry, result.Stage.VALIDATION, dont_filter = True))
+		if input or not finished:
+			raise scrapy.exceptions.DontCloseSpider()
+
 	# ------------------------------------
 
 	def __print_fallback(self, playwright: bool, status: int, url: str):
@@ -223,6 +367,13 @@ class ChadExtractorSpider(scrapy.Spider):
 				url = f"{status} {url}"
 			general.print_cyan(f"[ FALLBACK ] PW:{int(playwright)} | {url} -> Page.goto() to APIRequestContext.get()")
 
+	def __print_escalated(self, status: int, url: str, reason: str):
+		"""
+		Print escalated.
+		"""
+		if self.__debug:
+			general.print_cyan(f"[ ESCALATED ] PW:0 | {status} {url} -> {reason}")
+
 	def __print_error(self, playwright: bool, status: int, url: str, message: str):
 		"""
 		Print error.
@@ -239,12 +390,12 @@ class ChadExtractorSpider(scrapy.Spider):
 		if self.__debug:
 			general.print_yellow(f"[ REDIRECTED ] PW:{int(playwright)} | {request_url} -> {status} {response_url}")
 
-	def __print_success(self, playwright: bool, status: int, url: str):
+	def __print_success(self, stage: result.Stage, playwright: bool, status: int, url: str):
 		"""
 		Print success.
 		"""
 		if self.__debug:
-			general.print_green(f"[ {'VALIDATED'if self.__validation_started else 'EXTRACTED'} ] PW:{int(playwright)} | {status} {url}")
+			general.print_green(f"[ {'VALIDATED' if stage == result.Stage.VALIDATION else 'EXTRACTED'} ] PW:{int(playwright)} | {status} {url}")
 
 	def __print_success_no_results(self, playwright: bool, status: int, url: str):
 		"""
@@ -261,7 +412,12 @@ class ChadExtractor:
 		self,
 		shared_storage            : storage.Shared,
 		playwright                : bool,
+		playwright_auto           : bool,
+		playwright_markers        : list[str],
 		playwright_wait           : float,
+		playwright_wait_until     : str,
+		playwright_contexts       : int,
+		playwright_pages          : int,
 		concurrent_requests       : int,
 		concurrent_requests_domain: int,
 		sleep                     : float,
@@ -271,14 +427,22 @@ class ChadExtractor:
 		request_timeout           : float,
 		user_agents               : list[str],
 		proxy                     : str,
+		workers                   : int,
+		processes                 : int,
 		debug                     : bool
 	):
 		"""
-		Class for managing Scrapy's runner.
+		Class for managing Scrapy's runner.\n
+		If multiple crawler processes are specified, the input is split between them by domain name, and the global limits are split between them as well.
 		"""
 		self.__shared_storage             = shared_storage
 		self.__playwright                 = playwright
+		self.__playwright_auto            = playwright_auto
+		self.__playwright_markers         = playwright_markers
 		self.__playwright_wait            = playwright_wait
+		self.__playwright_wait_until      = playwright_wait_until
+		self.__playwright_contexts        = playwright_contexts
+		self.__playwright_pages           = playwright_pages
 		self.__concurrent_requests        = concurrent_requests
 		self.__concurrent_requests_domain = concurrent_requests_domain
 		self.__sleep                      = sleep
@@ -288,10 +452,13 @@ class ChadExtractor:
 		self.__request_timeout            = request_timeout # all timeouts
 		self.__user_agents                = user_agents
 		self.__proxy                      = proxy
+		self.__workers                    = workers
+		self.__processes                  = processes
 		self.__debug                      = debug
 		self.__headless_browser           = True
 		self.__browser_type               = "chromium" # Playwright's headless browser
 		self.__handle_sigint              = False
+		self.__interrupted                = False
 
 	def __page_block(self, request: PlaywrightRequest):
 		"""
@@ -299,9 +466,15 @@ class ChadExtractor:
 		"""
 		return request.resource_type in ["fetch", "stylesheet", "image", "ping", "font", "media", "imageset", "beacon", "csp_report", "object", "texttrack", "manifest"]
 
-	def __run(self):
+	def __share(self, value: int):
+		"""
+		Split a global limit between the crawler processes, at least one per process.
+		"""
+		return max(1, value // self.__processes) if value > 0 else value
+
+	def __run(self, shard: int):
 		"""
-		Configure the settings and run the Chad Extractor spider.
+		Configure the settings and run the Chad Extractor spider for the specified shard.
 		"""
 		settings = scrapy.utils.project.get_project_settings()
 		# --------------------------------
@@ -319,8 +492,8 @@ class ChadExtractor:
 		settings["AUTOTHROTTLE_MAX_DELAY"         ] = self.__sleep + 30
 		settings["AUTOTHROTTLE_TARGET_CONCURRENCY"] = self.__auto_throttle
 		# --------------------------------
-		settings["CONCURRENT_REQUESTS"           ] = self.__concurrent_requests
-		settings["CONCURRENT_REQUESTS_PER_DOMAIN"] = self.__concurrent_requests_domain
+		settings["CONCURRENT_REQUESTS"           ] = self.__share(self.__concurrent_requests)
+		settings["CONCURRENT_REQUESTS_PER_DOMAIN"] = self.__concurrent_requests_domain # all URLs of the same domain name are in the same shard
 		settings["RETRY_ENABLED"                 ] = self.__retries > 0
 		settings["RETRY_TIMES"                   ] = self.__retries
 		settings["REDIRECT_ENABLED"              ] = True
@@ -332,10 +505,14 @@ class ChadExtractor:
 		settings["LOG_ENABLED"                         ] = False
 		settings["REQUEST_FINGERPRINTER_IMPLEMENTATION"] = "2.7"
 		# --------------------------------
+		playwright = self.__playwright or self.__playwright_auto
 		if self.__shared_storage.is_validation_started():
-			self.__playwright, self.__playwright_wait = self.__shared_storage.require_playwright()
+			self.__playwright, self.__playwright_wait, self.__playwright_wait_until = self.__shared_storage.require_playwright()
+			playwright = self.__playwright
+		elif self.__shared_storage.is_pipeline_started():
+			playwright = playwright or self.__shared_storage.require_playwright()[0]
 		# --------------------------------
-		if self.__playwright:
+		if playwright: # requests without the `playwright` metadata fall back to Scrapy's default HTTP handler
 			settings["DOWNLOAD_HANDLERS"]["https"] = "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler"
 			settings["DOWNLOAD_HANDLERS"]["http" ] = "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler"
 			settings["TWISTED_REACTOR"           ] = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
@@ -347,19 +524,32 @@ class ChadExtractor:
 			settings["PLAYWRIGHT_BROWSER_TYPE"              ] = self.__browser_type
 			settings["PLAYWRIGHT_DEFAULT_NAVIGATION_TIMEOUT"] = self.__request_timeout * 1000
 			settings["PLAYWRIGHT_ABORT_REQUEST"             ] = self.__page_block
+			settings["PLAYWRIGHT_MAX_PAGES_PER_CONTEXT"     ] = self.__playwright_pages
 		# --------------------------------
 		crawler = scrapy.crawler.CrawlerProcess(settings)
-		crawler.crawl(ChadExtractorSpider, self.__shared_storage, self.__playwright, self.__playwright_wait, self.__request_timeout, self.__user_agents, self.__proxy, self.__debug); crawler.start(); crawler.join()
+		crawler.crawl(ChadExtractorSpider, self.__shared_storage, self.__playwright, self.__playwright_auto, self.__playwright_markers, self.__playwright_wait, self.__playwright_wait_until, context.Pool(self.__share(self.__playwright_contexts), self.__playwright_pages), self.__request_timeout, self.__user_agents, self.__proxy, self.__share(self.__workers), shard, self.__processes, self.__debug); crawler.start(); crawler.join()
 
 	def run(self):
 		"""
 		Run Scrapy's spider.
 		"""
-		process = multiprocessing.Process(target = self.__run)
+		self.__shared_storage.start_shards(self.__processes)
+		processes = [multiprocessing.Process(target = self.__run, args = (shard,)) for shard in range(self.__processes)]
 		try:
-			process.start()
-			process.join()
+			for process in processes:
+				process.start()
+			for process in processes:
+				process.join()
 		except KeyboardInterrupt:
-			process.terminate()
-			process.join()
+			self.__interrupted = True
+			for process in processes:
+				process.terminate()
+			for process in processes:
+				process.join()
 		return self.__shared_storage.has_success()
+
+	def is_interrupted(self):
+		"""
+		Check if any run was interrupted.
+		"""
+		return self.__interrupted
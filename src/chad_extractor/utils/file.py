@@ -2,10 +2,12 @@
 
 from . import array
 
-import os
+import mmap, os, typing
 
 __ENCODING = "ISO-8859-1"
 
+__WHITESPACE = frozenset(byte for byte in range(256) if chr(byte).isspace()) # bytes stripped from text decoded as ISO-8859-1
+
 def is_file(file: str):
 	"""
 	Returns `True` if the `file` exists and is a regular file.
@@ -41,6 +43,35 @@ def read(file: str):
 	"""
 	return open(file, "r", encoding = __ENCODING).read().strip()
 
+def read_windows(file: str, size: int, overlap: int) -> typing.Iterator[tuple[str, int, int, int]]:
+	"""
+	Read a file as text through a memory map, one chunk of the specified size at a time, along with the overlaps on both sides of the chunk.\n
+	Whitespace will be stripped from the text as a whole, so a file that fits into a single chunk is read the same as with `read()`.\n
+	Yields the text of each window, the offset of the window in the file, and the start and end offsets of the chunk in the window.
+	"""
+	with open(file, "rb") as stream:
+		length = os.fstat(stream.fileno()).st_size
+		if not length:
+			return # an empty file cannot be mapped
+		with mmap.mmap(stream.fileno(), 0, access = mmap.ACCESS_READ) as mapped:
+			low, high = 0, length
+			while low < high and mapped[low] in __WHITESPACE:
+				low += 1
+			while high > low and mapped[high - 1] in __WHITESPACE:
+				high -= 1
+			for start in range(low, high, size):
+				end = min(start + size, high)
+				window_start, window_end = max(low, start - overlap), min(high, end + overlap)
+				yield mapped[window_start:window_end].decode(__ENCODING), window_start, start - window_start, end - window_start
+
+def read_chunks(file: str, size = 1024 * 1024):
+	"""
+	Read a file as text in chunks of the specified size, so the whole file is never held in memory.
+	"""
+	with open(file, "r", encoding = __ENCODING) as stream:
+		while chunk := stream.read(size):
+			yield chunk
+
 def read_array(file: str, sort = False):
 	"""
 	Read a file line by line, and append the lines to a list.\n
@@ -55,27 +86,41 @@ def read_array(file: str, sort = False):
 				tmp.append(line)
 	return array.unique(tmp, sort)
 
-def overwrite(text: str, out: str):
+def __write(text: str | typing.Iterable[str], out: str):
+	"""
+	Write a text, or chunks of a text, to an output file.
+	"""
+	with open(out, "w") as stream:
+		if isinstance(text, str):
+			stream.write(text)
+		else:
+			stream.writelines(text)
+
+def overwrite(text: str | typing.Iterable[str], out: str):
 	"""
-	Write a text to an output file.\n
-	If the output file exists, prompt to overwrite it.
+	Write a text, or chunks of a text as they are produced, to an output file.\n
+	If the output file exists, prompt to overwrite it.\n
+	Returns `True` if the text was written.
 	"""
+	success = False
 	confirm = "yes"
 	if os.path.isfile(out):
 		print(f"'{out}' already exists")
 		confirm = input("Overwrite the output file (yes): ")
 	if confirm.lower() in ["yes", "y"]:
 		try:
-			open(out, "w").write(text)
+			__write(text, out)
 			print(f"Results have been saved to '{out}'")
+			success = True
 		except FileNotFoundError:
 			print(f"Cannot save the results to '{out}'")
+	return success
 
-def write_silent(text: str, out: str):
+def write_silent(text: str | typing.Iterable[str], out: str):
 	"""
-	Silently write a text to an output file.
+	Silently write a text, or chunks of a text as they are produced, to an output file.
 	"""
 	try:
-		open(out, "w").write(text)
+		__write(text, out)
 	except Exception:
 		pass
@@ -1,7 +1,7 @@
 
 #!/usr/bin/env python3
 
-import dataclasses, json
+import dataclasses, itertools, json, typing
 
 @dataclasses.dataclass
 class Input:
@@ -15,10 +15,11 @@ class Input:
 @dataclasses.dataclass
 class InputGrouped:
 	"""
-	Class for storing an input used for extraction or validation grouped by URL.
+	Class for storing an input used for extraction or validation grouped by URL.\n
+	During validation, the URL is validated against every key it was extracted by.
 	"""
 	url  : str
-	key  : str
+	keys : list[str]
 	files: list[str]
 
 # ----------------------------------------
@@ -32,18 +33,63 @@ class ChadResults:
 	proxy: str       = ""
 	urls : list[str] = dataclasses.field(default_factory = list)
 
-def deserialize_chad_results(chad_results_json: str) -> tuple[list[ChadResults] | None, str]:
-	"""
-	Deserialize Chad results from a JSON string.\n
-	Returns `None` and an error message on failure.
-	"""
-	results = None
-	message = ""
-	try:
-		tmp = json.loads(chad_results_json)
-		for i in range(len(tmp)):
-			tmp[i] = ChadResults(**tmp[i])
-		results = tmp
-	except Exception:
-		message = "Cannot deserialize Chad results"
-	return results, message
+def iterate_chad_results(chunks: typing.Iterable[str]) -> typing.Iterator[ChadResults]:
+	"""
+	Incrementally deserialize Chad results from chunks of a JSON array or JSON Lines string.\n
+	Only the unparsed remainder of the string is held in memory, and each entry is yielded as soon as it is parsed.\n
+	Raises `ValueError` on failure, including an empty string, after yielding all the entries before the malformed one.
+	"""
+	decoder = json.JSONDecoder()
+	buffer  = ""
+	start   = True  # the first character decides between a JSON array and JSON Lines
+	array   = False # inside the top-level JSON array
+	closed  = False # the top-level JSON array was closed, only whitespace may follow
+	state   = "["   # the last token inside the top-level JSON array, either "[", "," or "{" for an entry
+	for chunk in itertools.chain(chunks, [None]): # None marks the end of the string
+		eof = chunk is None
+		if not eof:
+			buffer += chunk
+		pos = 0
+		while True:
+			while pos < len(buffer) and buffer[pos].isspace():
+				pos += 1
+			if pos >= len(buffer):
+				break
+			if closed:
+				raise ValueError("Extra data after the JSON array")
+			if start:
+				start = False
+				if buffer[pos] == "[":
+					array = True
+					pos += 1
+					continue
+			if array:
+				if state == "{":
+					if buffer[pos] not in ",]":
+						raise ValueError("Expecting ',' delimiter between the JSON array elements")
+					closed = buffer[pos] == "]"
+					state  = buffer[pos]
+					pos   += 1
+					continue
+				if buffer[pos] == "]" and state == "[":
+					closed = True
+					pos   += 1
+					continue
+				if buffer[pos] in ",]":
+					raise ValueError("Expecting a JSON array element")
+			try:
+				entry, pos = decoder.raw_decode(buffer, pos)
+			except ValueError:
+				if eof:
+					raise
+				break # the entry continues in the next chunk
+			state = "{"
+			try:
+				yield ChadResults(**entry)
+			except TypeError as ex:
+				raise ValueError(str(ex))
+		buffer = buffer[pos:]
+	if start:
+		raise ValueError("Expecting a JSON array or JSON Lines, got an empty string")
+	if array and not closed:
+		raise ValueError("Unterminated JSON array")
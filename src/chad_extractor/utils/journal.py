@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+from . import result
+
+import dataclasses, json, os, threading
+
+SUCCESS    = "success"
+ERROR      = "error"
+NO_RESULTS = "no_results"
+
+@dataclasses.dataclass
+class Record:
+	"""
+	Class for storing a single journal record, i.e., a completed request or a scanned plaintext file.
+	"""
+	stage : result.Stage
+	status: str
+	keys  : list[str]
+	result: result.Result | result.ResultPlaintext
+
+class Journal:
+
+	def __init__(self, path: str, resume: bool):
+		"""
+		Class for managing an append-only journal of completed requests, one JSON object per line, so an interrupted run can be resumed.\n
+		Each record is flushed as soon as it is written, so at most the record being written is lost on a crash.\n
+		Records are written one at a time, as the shared storage process serves multiple crawler processes concurrently.\n
+		If not resuming, the existing journal is removed.
+		"""
+		self.__path   = path
+		self.__resume = resume
+		self.__stream = None
+		self.__lock   = threading.Lock()
+		if not self.__resume and os.path.isfile(self.__path):
+			os.remove(self.__path)
+
+	def __getstate__(self):
+		"""
+		The stream and the lock cannot be sent to the shared storage process, so only the options are.
+		"""
+		return {"path": self.__path, "resume": self.__resume}
+
+	def __setstate__(self, state: dict):
+		self.__path   = state["path"]
+		self.__resume = state["resume"]
+		self.__stream = None
+		self.__lock   = threading.Lock()
+
+	def read(self) -> list[Record]:
+		"""
+		Read all the records if resuming.\n
+		A truncated last record, e.g., due to a crash, is skipped.
+		"""
+		tmp = []
+		if self.__resume:
+			try:
+				with open(self.__path, "r", encoding = "UTF-8") as stream:
+					for line in stream:
+						try:
+							record = json.loads(line)
+							res    = result.ResultPlaintext(**record["result"]) if "file" in record["result"] else result.Result(**record["result"])
+							tmp.append(Record(result.Stage(record["stage"]), record["status"], record["keys"], res))
+						except (ValueError, KeyError, TypeError):
+							pass
+			except FileNotFoundError:
+				pass
+		return tmp
+
+	def __ends_with_newline(self):
+		"""
+		Check if the journal is empty or ends with a new line.
+		"""
+		with open(self.__path, "rb") as stream:
+			stream.seek(0, os.SEEK_END)
+			if stream.tell() == 0:
+				return True
+			stream.seek(-1, os.SEEK_END)
+			return stream.read(1) == b"\n"
+
+	def remove(self):
+		"""
+		Remove the journal, e.g., once the run is complete and the report has been written, so a later run does not resume from it.
+		"""
+		with self.__lock:
+			if self.__stream:
+				self.__stream.close()
+				self.__stream = None
+			if os.path.isfile(self.__path):
+				os.remove(self.__path)
+
+	def write(self, stage: result.Stage, status: str, keys: list[str], res: result.Result | result.ResultPlaintext):
+		"""
+		Append a record to the journal.
+		"""
+		record = json.dumps({"stage": stage.value, "status": status, "keys": keys, "result": dataclasses.asdict(res)}, ensure_ascii = False) + "\n"
+		with self.__lock:
+			if not self.__stream:
+				self.__stream = open(self.__path, "a", encoding = "UTF-8")
+				if not self.__ends_with_newline():
+					self.__stream.write("\n") # do not append to a truncated last record
+			self.__stream.write(record)
+			self.__stream.flush()
@@ -2,31 +2,28 @@
 
 from . import array, input, result
 
-import collections
+import collections, typing
 
-def select_urls(obj: list[input.ChadResults], sort = False):
+def group_by_url(obj: typing.Iterable[input.Input]) -> list[input.InputGrouped]:
 	"""
-	Get all `ChadResults.urls`.\n
-	Returns a unique [sorted] list.
+	Group the input by `Input.url`, collecting all `Input.key` and `Input.file`.\n
+	The input can be a generator, as it is iterated only once.
 	"""
-	tmp = []
+	grouped: dict[str, input.InputGrouped] = {}
 	for entry in obj:
-		tmp.extend(entry.urls)
-	return array.unique(tmp, sort)
-
-def group_by_url(obj: list[input.Input]) -> list[input.InputGrouped]:
-	"""
-	Group the input by `Input.url`.
-	"""
-	grouped = collections.defaultdict(lambda: input.InputGrouped("", "", []))
-	for entry in obj:
-		grouped[entry.url].url = entry.url
-		grouped[entry.url].key = entry.key
-		grouped[entry.url].files.append(entry.file)
-	tmp = []
-	for entry in list(grouped.values()):
-		entry.files = array.unique(entry.files, sort = True)
-		tmp.append(entry)
+		tmp = grouped.get(entry.url)
+		if not tmp:
+			tmp = grouped[entry.url] = input.InputGrouped(entry.url, [], [])
+		if entry.key and entry.key not in tmp.keys:
+			tmp.keys.append(entry.key)
+		if entry.file not in tmp.files:
+			tmp.files.append(entry.file)
+	tmp = list(grouped.values())
+	for entry in tmp: # already unique
+		if len(entry.keys) > 1:
+			entry.keys = array.unique(entry.keys, sort = True)
+		if len(entry.files) > 1:
+			entry.files = array.unique(entry.files, sort = True)
 	return tmp
 
 # ----------------------------------------
@@ -42,6 +39,17 @@ def select_results(obj: list[result.Result | result.ResultPlaintext], sort = Fal
 			tmp.extend(entry.results[key])
 	return array.unique(tmp, sort)
 
+def merge_results(first: dict[str, list[str]], second: dict[str, list[str]]) -> dict[str, list[str]]:
+	"""
+	Merge two `Result.results`.\n
+	Returns a dictionary with unique sorted lists.
+	"""
+	tmp = {}
+	for key in list(first.keys()) + list(second.keys()):
+		if key not in tmp:
+			tmp[key] = array.unique(first.get(key, []) + second.get(key, []), sort = True)
+	return tmp
+
 # ----------------------------------------
 
 def sort_by_url(obj: list[result.Result]):
@@ -90,34 +98,24 @@ def select_files(obj: list[result.Result], sort = False):
 
 # ----------------------------------------
 
-def select_by_file(obj: list[result.ResultPlaintext], file: str) -> list[result.ResultPlaintext]:
+def group_by_file(obj: list[result.ResultPlaintext]) -> dict[str, list[result.ResultPlaintext]]:
 	"""
-	Get all `Result` for the specified file.
+	Index the results by `ResultPlaintext.file` in a single pass.\n
+	Only the first result is kept for each file.
 	"""
-	tmp = []
+	tmp = {}
 	for entry in obj:
-		if file == entry.file:
-			tmp.append(entry)
-			break
+		if entry.file not in tmp:
+			tmp[entry.file] = [entry]
 	return tmp
 
-def select_by_files(obj: list[result.Result], file: str) -> list[result.Result]:
+def group_by_files(obj: list[result.Result]) -> dict[str, list[result.Result]]:
 	"""
-	Get all `Result` for the specified file.
+	Index the results by each of `Result.files` in a single pass.\n
+	The order of the results is preserved for each file.
 	"""
-	tmp = []
+	tmp = collections.defaultdict(list)
 	for entry in obj:
-		if file in entry.files:
-			tmp.append(entry)
-	return tmp
-
-def select_url_by_file(obj: list[result.Result], file: str, sort = False):
-	"""
-	Get all `Result` for the specified file.\n
-	Returns a unique [sorted] list.
-	"""
-	tmp = []
-	for entry in obj:
-		if file in entry.files:
-			tmp.append(entry.url)
-	return array.unique(tmp, sort)
+		for file in array.unique(entry.files):
+			tmp[file].append(entry)
+	return dict(tmp)
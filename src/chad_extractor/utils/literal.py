@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+import regex as re
+
+class Unsupported(Exception):
+	"""
+	Raised when a RegEx query uses a syntax that cannot be safely analyzed.
+	"""
+	pass
+
+class Parser:
+
+	def __init__(self, query: str):
+		"""
+		Class for finding the literals required by a RegEx query.\n
+		A requirement is a list of alternatives, at least one of which must appear in any content the RegEx query matches.\n
+		An empty list means no requirement is known.
+		"""
+		self.__query = query
+		self.__index = 0
+
+	def parse(self) -> list[str]:
+		"""
+		Parse the RegEx query and return its requirement.
+		"""
+		requirement = self.__parse_alternation()
+		if self.__index < len(self.__query):
+			raise Unsupported()
+		return requirement
+
+	def __peek(self, length = 1):
+		"""
+		Get the next characters without consuming them.
+		"""
+		return self.__query[self.__index:self.__index + length]
+
+	def __parse_alternation(self) -> list[str]:
+		"""
+		Every branch must have a requirement, otherwise the alternation has none.
+		"""
+		branches = [self.__parse_sequence()]
+		while self.__peek() == "|":
+			self.__index += 1
+			branches.append(self.__parse_sequence())
+		if len(branches) == 1:
+			return branches[0]
+		tmp = []
+		for branch in branches:
+			if not branch:
+				return []
+			tmp.extend(branch)
+		return unique(tmp)
+
+	def __parse_sequence(self) -> list[str]:
+		"""
+		Consecutive literal characters are joined, and the most selective requirement in the sequence is returned.\n
+		Quantifiers of zero-width atoms are consumed too, so they are never mistaken for literals.
+		"""
+		candidates = []
+		run = ""
+		while self.__index < len(self.__query) and self.__peek() not in ["|", ")"]:
+			literal, requirement = self.__parse_atom()
+			minimum, quantified = self.__parse_quantifier()
+			if literal and minimum > 0:
+				run += literal
+				if not quantified:
+					continue
+			if run:
+				candidates.append([run])
+				run = ""
+			if requirement and minimum > 0:
+				candidates.append(requirement)
+		if run:
+			candidates.append([run])
+		return best(candidates)
+
+	def __parse_quantifier(self) -> tuple[int, bool]:
+		"""
+		Returns the minimum number of repetitions, and whether a quantifier was found.\n
+		Curly brackets other than a numeric quantifier, e.g., fuzzy matching constraints, cannot be safely analyzed.
+		"""
+		minimum = 1
+		char = self.__peek()
+		if char in ["?", "*"]:
+			minimum = 0
+			self.__index += 1
+		elif char == "+":
+			self.__index += 1
+		elif char == "{":
+			match = re.match(r"\{(\d*)(?:,\d*)?\}", self.__query[self.__index:])
+			if not match:
+				raise Unsupported()
+			minimum = int(match.group(1)) if match.group(1) else 0
+			self.__index += len(match.group(0))
+		else:
+			return minimum, False
+		if self.__peek() in ["?", "+"]: # lazy or possessive
+			self.__index += 1
+		return minimum, True
+
+	def __parse_atom(self) -> tuple[str, list[str]]:
+		"""
+		Returns a literal character, if any, and a requirement.
+		"""
+		char = self.__peek()
+		self.__index += 1
+		if char == "\\":
+			return self.__parse_escape()
+		elif char == "[":
+			self.__skip_class()
+			return "", []
+		elif char == "(":
+			return self.__parse_group()
+		elif char == "{":
+			raise Unsupported()
+		elif char in ["^", "$", ".", "}"]:
+			return "", []
+		return char, []
+
+	def __parse_escape(self) -> tuple[str, list[str]]:
+		"""
+		Escaped non-alphanumeric characters are literals, everything else is a character class, a back reference, or zero-width.
+		"""
+		char = self.__peek()
+		self.__index += 1
+		if not char:
+			raise Unsupported()
+		elif not char.isalnum():
+			return char, []
+		elif char in "AbBGZzKmM": # zero-width
+			return "", []
+		elif char in "QE":
+			raise Unsupported()
+		elif char in "pPNgk":
+			match = re.match(r"\{[^\}]*\}|\<[^\>]*\>|[A-Za-z]", self.__query[self.__index:])
+			if match:
+				self.__index += len(match.group(0))
+		elif char == "x":
+			match = re.match(r"\{[0-9A-Fa-f]+\}|[0-9A-Fa-f]{1,2}", self.__query[self.__index:])
+			if match:
+				self.__index += len(match.group(0))
+		elif char == "u":
+			self.__index += 4
+		elif char == "U":
+			self.__index += 8
+		elif char.isdigit():
+			while self.__peek().isdigit():
+				self.__index += 1
+		return "", []
+
+	def __skip_class(self):
+		"""
+		Skip a character class, including the POSIX ones.
+		"""
+		if self.__peek() == "^":
+			self.__index += 1
+		if self.__peek() == "]":
+			self.__index += 1
+		while self.__index < len(self.__query):
+			char = self.__peek()
+			if char == "\\":
+				self.__index += 2
+			elif self.__peek(2) == "[:":
+				end = self.__query.find(":]", self.__index + 2)
+				self.__index = end + 2 if end >= 0 else self.__index + 1
+			elif char == "]":
+				self.__index += 1
+				return
+			else:
+				self.__index += 1
+		raise Unsupported()
+
+	def __parse_group(self) -> tuple[str, list[str]]:
+		"""
+		Negative lookarounds have no requirement.
+		"""
+		negative = False
+		if self.__peek() == "?":
+			self.__index += 1
+			char = self.__peek()
+			if char in [":", ">", "|"]:
+				self.__index += 1
+			elif char in ["=", "!"]:
+				self.__index += 1
+				negative = char == "!"
+			elif self.__peek(2) in ["<=", "<!"]:
+				negative = self.__peek(2) == "<!"
+				self.__index += 2
+			elif char == "<" or self.__peek(2) == "P<":
+				end = self.__query.find(">", self.__index)
+				if end < 0:
+					raise Unsupported()
+				self.__index = end + 1
+			elif char == "#":
+				end = self.__query.find(")", self.__index)
+				if end < 0:
+					raise Unsupported()
+				self.__index = end + 1
+				return "", []
+			else: # conditionals, recursion, inline flags, etc.
+				raise Unsupported()
+		requirement = self.__parse_alternation()
+		if self.__peek() != ")":
+			raise Unsupported()
+		self.__index += 1
+		return "", [] if negative else requirement
+
+# ----------------------------------------
+
+def unique(literals: list[str]):
+	"""
+	Remove case-insensitive duplicates from a list of literals.
+	"""
+	seen = set()
+	return [x for x in literals if not (x.casefold() in seen or seen.add(x.casefold()))]
+
+def score(requirement: list[str]):
+	"""
+	Score a requirement by its shortest alternative, and then by the number of alternatives.
+	"""
+	return (min(len(literal) for literal in requirement), -len(requirement)) if requirement else (0, 0)
+
+def best(requirements: list[list[str]]):
+	"""
+	Get the most selective requirement.
+	"""
+	return max(requirements, key = score) if requirements else []
+
+def get_required(query: str, min_length = 3) -> list[str]:
+	"""
+	Get the literals required by a RegEx query, at least one of which must appear in any content the RegEx query matches.\n
+	Returns an empty list if the RegEx query cannot be analyzed, or if the literals are too short to be worth searching for.
+	"""
+	tmp = []
+	try:
+		tmp = Parser(query).parse()
+	except (Unsupported, IndexError):
+		pass
+	if tmp and score(tmp)[0] < min_length:
+		tmp = []
+	return tmp
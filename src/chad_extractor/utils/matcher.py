@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+from . import array, general, template
+
+import bisect, regex as re, typing
+
+class Matcher:
+
+	def __init__(
+		self,
+		template  : template.Template,
+		excludes  : list[str],
+		validation: bool,
+		debug     : bool
+	):
+		"""
+		Class for matching an HTTP response content against the template.\n
+		Meant to be built once per process, so only the matches have to be shared between processes.\n
+		All RegEx queries are compiled once, and each extraction RegEx query is run only if any of its required literals, if known, appears in the content.\n
+		Excluded content is never removed from the content, extraction RegEx queries simply ignore the matches that are not within the gaps between the excluded spans.
+		"""
+		self.__template   = template
+		self.__excludes   = excludes
+		self.__validation = validation
+		self.__debug      = debug
+		self.__flags      = re.MULTILINE | re.IGNORECASE
+		self.__queries    = {} # key -> compiled RegEx query
+		self.__literals   = {} # key -> required literals
+		self.__probes     = {} # literal -> compiled RegEx query
+		self.__contains   = {} # literal -> shorter literals it contains
+		self.__exclude    = None
+		self.__compile()
+
+	def __compile(self):
+		"""
+		Compile the RegEx queries of the current stage, and index the required literals of the extract RegEx queries.\n
+		Template entries with an invalid RegEx query are skipped.\n
+		All exclude RegEx queries are combined into a single one, with a branch reset, so each keeps its own group numbers.
+		"""
+		if not self.__validation and self.__excludes:
+			self.__exclude = re.compile(f"(?|{('|').join(f'(?:{query})' for query in self.__excludes)})", flags = self.__flags)
+		for key, value in self.__template.entries.items():
+			query = value.validate if self.__validation else value.extract
+			try:
+				self.__queries[key] = re.compile(query, flags = self.__flags)
+			except re.error as ex:
+				if self.__debug:
+					general.print_red(f"{key}: {ex}")
+				continue
+			if not self.__validation and value.extract_literals:
+				self.__literals[key] = value.extract_literals
+				for literal in value.extract_literals:
+					if literal not in self.__probes:
+						self.__probes[literal] = re.compile(re.escape(literal), flags = self.__flags)
+		for literal in self.__probes:
+			self.__contains[literal] = []
+			if literal.isascii():
+				for contained in self.__probes:
+					if len(contained) < len(literal) and contained.isascii() and contained.lower() in literal.lower():
+						self.__contains[literal].append(contained)
+
+	def __is_present(self, literal: str, content: str, present: dict[str, bool]):
+		"""
+		Check if a literal is present in the content, searching for it at most once per content.\n
+		A literal is not searched for if any shorter literal it contains is already known to be absent.
+		"""
+		if literal not in present:
+			present[literal] = all(self.__is_present(contained, content, present) for contained in self.__contains[literal]) and bool(self.__probes[literal].search(content))
+		return present[literal]
+
+	def __get_gaps(self, content: str) -> list[tuple[int, int]]:
+		"""
+		Get the spans of the content between the excluded spans, in a single pass.
+		"""
+		gaps = []
+		last = 0
+		if self.__exclude:
+			for match in self.__exclude.finditer(content):
+				start, end = match.span()
+				if start > last:
+					gaps.append((last, start))
+				last = end
+		if last < len(content) or not gaps:
+			gaps.append((last, len(content)))
+		return gaps
+
+	def __findall(self, query: re.Pattern, content: str, gaps: list[tuple[int, int]], starts: list[int]) -> list:
+		"""
+		Find all matches within the gaps.\n
+		Matches might repeat.
+		"""
+		if len(gaps) == 1:
+			return query.findall(content, *gaps[0])
+		return [self.__get_value(query, match)[0] for match in self.__iterate(query, content, gaps, starts)]
+
+	def __iterate(self, query: re.Pattern, content: str, gaps: list[tuple[int, int]], starts: list[int]) -> typing.Iterator[re.Match]:
+		"""
+		Iterate over all matches within the gaps, gap by gap, the same as if each gap was searched on its own.\n
+		The content is searched as a whole, and only the gaps touched by a match crossing an excluded span are searched again on their own.\n
+		A crossing match shifts where the following matches line up, so all the first-pass matches within a touched gap are replaced by its own matches.
+		"""
+		matches = {} # gap index -> first-pass matches within the gap
+		touched = set()
+		for match in query.finditer(content):
+			start, end = match.span()
+			i = bisect.bisect_right(starts, start) - 1
+			if i >= 0 and start < gaps[i][1] and end <= gaps[i][1]:
+				matches.setdefault(i, []).append(match)
+				continue
+			if i >= 0 and start < gaps[i][1]:
+				touched.add(i)
+			i += 1
+			while i < len(gaps) and gaps[i][0] < end:
+				touched.add(i)
+				i += 1
+		for i in sorted(touched | matches.keys()):
+			yield from query.finditer(content, *gaps[i]) if i in touched else matches[i]
+
+	def parse_response(self, content: str, keys: list[str] = []) -> dict[str, list[str]] | list[str]:
+		"""
+		Parse an HTTP response content as a result of extraction or validation.\n
+		During extraction, returns the matches of all template entries.\n
+		During validation, returns the specified keys whose `validate` RegEx query matches, so a URL is fetched once and validated against all its keys.
+		"""
+		tmp = {} if not self.__validation else []
+		try:
+			if not self.__validation:
+				gaps   = self.__get_gaps(content)
+				starts = [gap[0] for gap in gaps]
+				present = {}
+				for key, query in self.__queries.items():
+					if key in self.__literals and not any(self.__is_present(literal, content, present) for literal in self.__literals[key]):
+						continue
+					matches = self.__findall(query, content, gaps, starts)
+					if matches:
+						value = self.__template.entries[key]
+						if value.extract_prepend or value.extract_append:
+							for i in range(len(matches)):
+								matches[i] = value.extract_prepend + matches[i] + value.extract_append
+						tmp[key] = array.unique(matches, sort = True)
+			else:
+				for key in keys:
+					if key in self.__queries and self.__queries[key].search(content):
+						tmp.append(key)
+		except re.error as ex:
+			if self.__debug:
+				general.print_red(str(ex))
+		return tmp
+
+	def parse_window(self, content: str, start: int, end: int) -> dict[str, dict[str, list[int]]]:
+		"""
+		Parse a window of a larger content as a result of extraction, e.g., a chunk of a file along with the overlaps around it.\n
+		Only the matches starting within the `start` and `end` offsets are kept, so adjacent windows do not repeat matches.\n
+		Returns the matches of all template entries, each with the offsets, relative to the window, of all its occurrences.
+		"""
+		tmp = {}
+		try:
+			gaps   = self.__get_gaps(content)
+			starts = [gap[0] for gap in gaps]
+			present = {}
+			for key, query in self.__queries.items():
+				if key in self.__literals and not any(self.__is_present(literal, content, present) for literal in self.__literals[key]):
+					continue
+				value   = self.__template.entries[key]
+				matches = {}
+				for match, offset in self.__finditer(query, content, gaps, starts):
+					if start <= offset < end:
+						matches.setdefault(value.extract_prepend + match + value.extract_append, []).append(offset)
+				if matches:
+					tmp[key] = matches
+		except re.error as ex:
+			if self.__debug:
+				general.print_red(str(ex))
+		return tmp
+
+	def __finditer(self, query: re.Pattern, content: str, gaps: list[tuple[int, int]], starts: list[int]) -> typing.Iterator[tuple[str, int]]:
+		"""
+		Same as `__findall()`, but also yields the offset of each match.
+		"""
+		matches = query.finditer(content, *gaps[0]) if len(gaps) == 1 else self.__iterate(query, content, gaps, starts)
+		for match in matches:
+			yield self.__get_value(query, match)
+
+	def __get_value(self, query: re.Pattern, match: re.Match) -> tuple[str, int]:
+		"""
+		Get the value of a match the same way `findall()` does, and its offset.\n
+		If the RegEx query has a single group, the offset is of the group, if matched.
+		"""
+		if not query.groups:
+			return match.group(0), match.start()
+		elif query.groups == 1:
+			return match.group(1) or "", match.start(1) if match.start(1) >= 0 else match.start()
+		return match.groups(""), match.start()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+from . import array, file, general, matcher, result, storage
+
+import concurrent.futures, os, time
+
+worker_matcher: matcher.Matcher | None = None
+worker_chunk  : tuple[int, int]        = (0, 0)
+worker_offsets: bool                   = False
+
+def initialize(shared_matcher: matcher.Matcher, chunk_size: int, chunk_overlap: int, offsets: bool):
+	"""
+	Store the matcher and the scanning options in the worker process.
+	"""
+	global worker_matcher, worker_chunk, worker_offsets
+	worker_matcher = shared_matcher
+	worker_chunk   = (chunk_size, chunk_overlap)
+	worker_offsets = offsets
+
+def parse_file(path: str) -> tuple[str, dict[str, list[str]], dict[str, dict[str, list[int]]], int]:
+	"""
+	Parse a plaintext file in the worker process, or in the current process if there are no workers.\n
+	The file is scanned one chunk at a time, so only a single chunk, along with its overlaps, is held in memory.\n
+	Returns the path, the results, the byte offsets of the results if requested, and the number of bytes scanned.
+	"""
+	tmp = {}
+	for content, offset, start, end in file.read_windows(path, *worker_chunk):
+		if not worker_offsets and start == 0 and end == len(content): # the whole file fits into a single chunk
+			return path, worker_matcher.parse_response(content), {}, os.path.getsize(path)
+		for key, matches in worker_matcher.parse_window(content, start, end).items():
+			for match, offsets in matches.items():
+				tmp.setdefault(key, {}).setdefault(match, []).extend(offset + i for i in offsets if worker_offsets)
+	results = {key: array.unique(list(matches), sort = True) for key, matches in tmp.items()}
+	offsets = {key: {match: sorted(set(tmp[key][match])) for match in matches} for key, matches in results.items()} if worker_offsets else {}
+	return path, results, offsets, os.path.getsize(path)
+
+# ----------------------------------------
+
+class Engine:
+
+	def __init__(
+		self,
+		shared_storage: storage.Shared,
+		input         : list[str],
+		chunk_size    : int,
+		chunk_overlap : int,
+		offsets       : bool,
+		workers       : int,
+		debug         : bool
+	):
+		"""
+		Class for extracting data from plaintext files, treating them like server responses.\n
+		Files are scanned in chunks, in a pool of worker processes, if any, from the largest to the smallest, so the largest files do not end up last.\n
+		Results are appended to the shared storage as soon as each file is scanned, and if resuming, the journaled files are skipped.
+		"""
+		self.__shared_storage = shared_storage
+		self.__input          = input
+		self.__options        = (chunk_size, chunk_overlap, offsets)
+		self.__workers        = workers
+		self.__debug          = debug
+		self.__files          = 0
+		self.__bytes          = 0
+
+	def run(self):
+		"""
+		Scan all the files and print the throughput.\n
+		Returns `True` if any data was extracted.
+		"""
+		start = time.perf_counter()
+		paths = sorted([path for path in self.__input if not self.__shared_storage.is_file_processed(path)], key = os.path.getsize, reverse = True)
+		if self.__workers > 0:
+			with concurrent.futures.ProcessPoolExecutor(max_workers = self.__workers, initializer = initialize, initargs = (self.__shared_storage.get_matcher(), *self.__options)) as executor:
+				futures = {executor.submit(parse_file, path): path for path in paths}
+				for future in concurrent.futures.as_completed(futures):
+					try:
+						self.__append(*future.result())
+					except OSError as ex:
+						self.__print_error(futures[future], ex)
+		else:
+			initialize(self.__shared_storage.get_matcher(), *self.__options)
+			for path in paths:
+				try:
+					self.__append(*parse_file(path))
+				except OSError as ex:
+					self.__print_error(path, ex)
+		elapsed = max(time.perf_counter() - start, 1e-6)
+		size    = self.__bytes / 1024 / 1024
+		print(general.get_timestamp(f"Number of files scanned: {self.__files} ({size:.2f} MB at {size / elapsed:.2f} MB/s)"))
+		return self.__shared_storage.has_success()
+
+	def __append(self, path: str, results: dict[str, list[str]], offsets: dict[str, dict[str, list[int]]], size: int):
+		"""
+		Append the results of a file to the shared storage.
+		"""
+		self.__files += 1
+		self.__bytes += size
+		if results:
+			self.__shared_storage.append_success(result.ResultPlaintext(path, results, offsets))
+		else:
+			self.__shared_storage.append_no_results(result.ResultPlaintext(path))
+
+	def __print_error(self, path: str, ex: OSError):
+		"""
+		Print an error message if debugging is enabled.
+		"""
+		if self.__debug:
+			general.print_red(f"Cannot read \"{path}\": {ex}")
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
-from . import config, file, general, jquery, result
+from . import config, file, jquery, result
 
-import dataclasses
+import dataclasses, json, os
 
 def save(results: result.Results, started_at: str, ended_at: str, out: str, verbose: bool, plaintext: bool):
 	"""
+	Returns `True` if the primary report was written.
 	"""
 	# ------------------------------------
 	tmp = Report(started_at, ended_at)
@@ -28,23 +29,30 @@ def save(results: result.Results, started_at: str, ended_at: str, out: str, verb
 	extracted_error       = jquery.sort_by_url(extracted_error)
 	tmp.failed.extraction = jquery.select_url(extracted_error)
 	# ------------------------------------
-	file.overwrite(get_primary(tmp, plaintext), out)
+	success = file.overwrite(get_primary(tmp, plaintext), out)
 	# ------------------------------------
 	if verbose:
+		# --------------------------------
+		extracted_by_file       = jquery.group_by_file(extracted) if plaintext else jquery.group_by_files(extracted)
+		validated_by_file       = jquery.group_by_files(validated)
+		validated_error_by_file = jquery.group_by_files(validated_error)
+		extracted_error_by_file = jquery.group_by_files(extracted_error)
+		# --------------------------------
 		for path in jquery.select_file(extracted) if plaintext else jquery.select_files(extracted):
 			# ----------------------------
 			tmp = Report(started_at, ended_at)
 			# ----------------------------
-			tmp.summary.validated = jquery.select_url_by_file(validated, path)
+			tmp.summary.validated = jquery.select_url(validated_by_file.get(path, []))
 			# ----------------------------
-			tmp.full              = jquery.select_by_file(extracted, path) if plaintext else jquery.select_by_files(extracted, path)
+			tmp.full              = extracted_by_file.get(path, [])
 			tmp.summary.extracted = jquery.select_results(tmp.full, sort = True)
 			# ----------------------------
-			tmp.failed.validation = jquery.select_url_by_file(validated_error, path)
+			tmp.failed.validation = jquery.select_url(validated_error_by_file.get(path, []))
 			# ----------------------------
-			tmp.failed.extraction = jquery.select_url_by_file(extracted_error, path)
+			tmp.failed.extraction = jquery.select_url(extracted_error_by_file.get(path, []))
 			# ----------------------------
 			file.write_silent(get_secondary(tmp, plaintext), path.rsplit(".", 1)[0] + config.REPORT_EXTENSION)
+	return success
 
 @dataclasses.dataclass
 class ReportSummary:
@@ -70,26 +78,82 @@ class Report:
 	failed    : ReportFailed  = dataclasses.field(default_factory = ReportFailed)
 	full      : list          = dataclasses.field(default_factory = list)
 
+class Encoder(json.JSONEncoder):
+
+	def __init__(self, excludes: list[str] = []):
+		"""
+		Class for serializing a report to a JSON string incrementally, see `iterencode()`.\n
+		The output is identical to `general.jdump()`, but dataclasses are converted one at a time, so the whole report is never copied.\n
+		Fields in `excludes` are omitted from every dataclass.
+		"""
+		super().__init__(indent = 4, ensure_ascii = False)
+		self.__excludes = excludes
+
+	def default(self, o):
+		if dataclasses.is_dataclass(o):
+			return {field.name: getattr(o, field.name) for field in dataclasses.fields(o) if field.name not in self.__excludes}
+		return super().default(o)
+
 def get_primary(report: Report, plaintext: bool):
 	"""
+	Returns an iterator over the chunks of the serialized report.
 	"""
-	tmp = dataclasses.asdict(report)
-	if not plaintext:
-		for entry in tmp.get("full", []):
-			del entry["files"]
-	else:
-		del tmp["failed"]["extraction"]
-	return general.jdump(tmp)
+	tmp = {
+		"started_at": report.started_at,
+		"ended_at"  : report.ended_at,
+		"summary"   : report.summary,
+		"failed"    : {"validation": report.failed.validation} if plaintext else report.failed,
+		"full"      : report.full
+	}
+	return Encoder(excludes = __get_excludes(report, plaintext)).iterencode(tmp)
 
 def get_secondary(report: Report, plaintext: bool):
 	"""
+	Returns an iterator over the chunks of the serialized report.
+	"""
+	if not plaintext:
+		return get_primary(report, plaintext)
+	tmp = {
+		"started_at": report.started_at,
+		"ended_at"  : report.ended_at,
+		"summary"   : report.summary,
+		"failed"    : {"validation": report.failed.validation},
+		"results"   : report.full[0].results
+	}
+	if report.full[0].offsets:
+		tmp["offsets"] = report.full[0].offsets
+	return Encoder().iterencode(tmp)
+
+def __get_excludes(report: Report, plaintext: bool):
+	"""
+	Get the fields to omit from the results.\n
+	Byte offsets of plaintext results are omitted unless requested.
 	"""
-	tmp = dataclasses.asdict(report)
 	if not plaintext:
-		for entry in tmp.get("full", []):
-			del entry["files"]
-	else:
-		del tmp["failed"]["extraction"]
-		tmp["results"] = tmp["full"][0]["results"]
-		del tmp["full"]
-	return general.jdump(tmp)
+		return ["files"]
+	elif not any(entry.offsets for entry in report.full):
+		return ["offsets"]
+	return []
+
+# ----------------------------------------
+
+class Live:
+
+	def __init__(self, out: str, resume: bool):
+		"""
+		Class for appending each result to a JSON Lines file as soon as it is produced, one JSON object per line.\n
+		If not resuming, the existing file is removed.
+		"""
+		self.__out    = out
+		self.__stream = None
+		if not resume and os.path.isfile(self.__out):
+			os.remove(self.__out)
+
+	def write(self, stage: result.Stage, status: str, res: result.Result | result.ResultPlaintext):
+		"""
+		Append a result to the file.
+		"""
+		if not self.__stream:
+			self.__stream = open(self.__out, "a", encoding = "UTF-8")
+		self.__stream.write(json.dumps({"stage": stage.value, "status": status, **dataclasses.asdict(res)}, ensure_ascii = False) + "\n")
+		self.__stream.flush()
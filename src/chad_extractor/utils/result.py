@@ -21,10 +21,12 @@ class Result:
 @dataclasses.dataclass
 class ResultPlaintext:
 	"""
-	Class for storing a plaintext result.
+	Class for storing a plaintext result.\n
+	If requested, `offsets` contains the byte offsets of all occurrences of each result, by key.
 	"""
 	file   : str
-	results: dict[str, list[str]] = dataclasses.field(default_factory = dict)
+	results: dict[str, list[str]]            = dataclasses.field(default_factory = dict)
+	offsets: dict[str, dict[str, list[int]]] = dataclasses.field(default_factory = dict)
 
 @dataclasses.dataclass
 class StageResults:
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+from . import template, wait
+
+import dataclasses
+
+@dataclasses.dataclass(frozen = True)
+class Settings:
+	"""
+	Class for storing the compiled validation settings of a combination of template keys.\n
+	Do not modify the dictionaries, they are shared by all requests with the same keys.
+	"""
+	headers              : dict[str, str]
+	headers_with_cookies : dict[str, str] # for APIRequestContext.get()
+	cookies              : dict[str, str]
+	playwright           : bool
+	playwright_wait      : float
+	playwright_wait_until: str
+
+class Snapshot:
+
+	def __init__(self, template: template.Template):
+		"""
+		Class for storing a read-only snapshot of the template's validation settings.\n
+		A crawler process fetches it once from the shared storage, so the settings of each request are looked up locally.\n
+		The settings are compiled once per combination of keys.
+		"""
+		self.__entries = dict(template.entries)
+		self.__cache   = {}
+
+	def get(self, keys: list[str]) -> Settings:
+		"""
+		Get the validation settings for the specified keys.
+		"""
+		tmp = tuple(keys)
+		if tmp not in self.__cache:
+			self.__cache[tmp] = self.__compile(keys)
+		return self.__cache[tmp]
+
+	def __compile(self, keys: list[str]):
+		"""
+		Compile the validation settings for the specified keys.\n
+		If multiple keys set the same header or cookie, the last key in the list wins.\n
+		Playwright's headless browser is required if required by any key, with the longest browser wait time and the merged wait condition.
+		"""
+		headers, cookies, playwright, playwright_wait, conditions = {}, {}, False, 0, []
+		for key in keys:
+			if key in self.__entries:
+				entry = self.__entries[key]
+				for name, value in entry.validate_headers.items():
+					headers[name.lower()] = value
+				for name, value in entry.validate_cookies.items():
+					cookies[name.lower()] = value
+				if entry.validate_browser:
+					playwright = True
+					playwright_wait = max(playwright_wait, entry.validate_browser_wait)
+					conditions.append(entry.validate_browser_wait_until)
+		headers_with_cookies = headers | ({"cookie": ("; ").join(f"{name}={value}" for name, value in cookies.items())} if cookies else {})
+		return Settings(headers, headers_with_cookies, cookies, playwright, playwright_wait, wait.merge(conditions))
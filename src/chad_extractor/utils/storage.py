@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from . import array, file, general, input, jquery, result, template
+from . import array, file, general, input, journal, jquery, matcher, report, result, snapshot, template, url
 
-import multiprocessing.managers, regex as re
+import collections, multiprocessing.managers, random, typing
 
 class MyManager(multiprocessing.managers.BaseManager):
 	pass
@@ -15,19 +15,59 @@ class Shared:
 		input    : list[str],
 		plaintext: bool,
 		excludes : list[str],
+		journal  : journal.Journal,
+		live     : report.Live | None,
 		debug    : bool
 	):
 		"""
-		Class for managing a shared storage in multiprocessing.
+		Class for managing a shared storage in multiprocessing.\n
+		Every completed request is written to the journal, and if resuming, the journaled results are loaded and the journaled requests are skipped.\n
+		If specified, every result is also written to the live output file as soon as it is appended.
 		"""
 		self.__template  = template
 		self.__input     = input
 		self.__plaintext = plaintext
 		self.__excludes  = excludes
 		self.__debug     = debug
-		self.__flags     = re.MULTILINE | re.IGNORECASE
 		self.__stage     = result.Stage.EXTRACTION
 		self.__results   = result.Results()
+		self.__matchers  = {}
+		self.__snapshot  = snapshot.Snapshot(self.__template)
+		self.__pipeline  = False
+		self.__queued    = set() # (URL, key) queued for validation in the pipeline mode
+		self.__pending   = []    # input queued for validation in the pipeline mode
+		self.__shards    = 1
+		self.__pages     = [[]]  # shard -> shuffled input, fed to the crawler process page by page
+		self.__split     = set() # URLs input twice, once with and once without the browser
+		self.__queues    = collections.defaultdict(list) # shard -> input queued for validation by other shards in the pipeline mode
+		self.__active    = set()                         # shards still extracting in the pipeline mode
+		self.__journal   = journal
+		self.__processed = set() # (stage, URL, keys) of the journaled requests
+		self.__live      = live
+		self.__resume()
+
+	def __resume(self):
+		"""
+		Load the journaled results.
+		"""
+		for record in self.__journal.read():
+			if record.status == journal.SUCCESS:
+				self.__results.results[record.stage].success.append(record.result)
+			elif record.status == journal.ERROR:
+				self.__results.results[record.stage].error.append(record.result)
+			self.__processed.add((record.stage, record.result.file if isinstance(record.result, result.ResultPlaintext) else record.result.url, tuple(sorted(record.keys))))
+
+	def __is_processed(self, entry: input.InputGrouped, stage: result.Stage):
+		"""
+		Check if the request for the specified input was journaled.
+		"""
+		return (stage, entry.url, tuple(sorted(entry.keys))) in self.__processed
+
+	def is_file_processed(self, path: str):
+		"""
+		Check if the plaintext file was journaled as scanned.
+		"""
+		return (result.Stage.EXTRACTION, path, ()) in self.__processed
 
 	def start_validation(self):
 		"""
@@ -41,23 +81,134 @@ class Shared:
 		"""
 		return self.__stage == result.Stage.VALIDATION
 
-	def get_input(self) -> list[input.InputGrouped]:
+	def start_pipeline(self):
 		"""
-		Get the input used for extraction or validation.
+		Start validation alongside extraction, so the extracted data is validated in the same crawl as soon as it is extracted.\n
+		Returns `False` if no template entries have the `validate` RegEx.
 		"""
-		return self.__input
+		entries = {key: value for key, value in self.__template.entries.items() if value.validate}
+		self.__matchers[result.Stage.VALIDATION] = matcher.Matcher(template.Template(entries), self.__excludes, True, self.__debug)
+		self.__pipeline = True
+		return bool(entries)
+
+	def is_pipeline_started(self):
+		"""
+		Check if the pipeline mode has started.
+		"""
+		return self.__pipeline
+
+	def queue_validation(self, res: result.Result, shard = 0) -> list[input.InputGrouped]:
+		"""
+		Get the input used for validation from the data extracted in the pipeline mode.\n
+		Each URL is returned at most once per key.\n
+		If the input is split into shards, URLs of other shards are queued for their crawler processes, and only the input of the specified shard is returned.
+		"""
+		tmp = []
+		for key in res.results:
+			if self.__template.entries[key].validate:
+				for value in res.results[key]:
+					if (value, key) not in self.__queued:
+						self.__queued.add((value, key))
+						for path in res.files:
+							tmp.append(input.Input(value, key, path))
+		self.__pending.extend(tmp)
+		own = []
+		for entry in self.__split_by_playwright(jquery.group_by_url(tmp)):
+			if self.__is_processed(entry, result.Stage.VALIDATION):
+				continue
+			other = url.get_shard(entry.url, self.__shards)
+			if other == shard:
+				own.append(entry)
+			else:
+				self.__queues[other].append(entry)
+		return own
+
+	def pop_validation(self, shard = 0) -> list[input.InputGrouped]:
+		"""
+		Get and remove the input queued for validation by other shards for the specified shard in the pipeline mode.
+		"""
+		return self.__queues.pop(shard, [])
+
+	def finish_extraction(self, shard = 0):
+		"""
+		Mark the extraction of the specified shard as finished in the pipeline mode.
+		"""
+		self.__active.discard(shard)
+
+	def is_extraction_finished(self):
+		"""
+		Check if the extraction of all shards is finished in the pipeline mode.
+		"""
+		return not self.__active
+
+	def finish_pipeline(self):
+		"""
+		Finish the pipeline mode, and start validation to report its results.\n
+		A URL might be validated before it was extracted from all the files, so the files of all the validation results are collected only now.
+		"""
+		self.__stage = result.Stage.VALIDATION
+		self.__split = set()
+		self.__input = self.__split_by_playwright(jquery.group_by_url(self.__pending), self.__split)
+		files = collections.defaultdict(list)
+		for entry in self.__results.results[result.Stage.EXTRACTION].success:
+			for key in entry.results:
+				if self.__template.entries[key].validate:
+					for url in entry.results[key]:
+						files[url].extend(entry.files)
+		for entry in self.__results.results[result.Stage.VALIDATION].success + self.__results.results[result.Stage.VALIDATION].error:
+			entry.files = array.unique(files[entry.url], sort = True)
+
+	def start_shards(self, shards: int):
+		"""
+		Split the input into the specified number of shards by domain name, one per crawler process.\n
+		The input of each shard is shuffled once, here, so crawler processes can fetch it page by page.
+		"""
+		self.__shards = shards
+		self.__active = set(range(shards))
+		self.__pages  = [self.__input] if shards <= 1 else [[] for shard in range(shards)]
+		if shards > 1:
+			for entry in self.__input:
+				self.__pages[url.get_shard(entry.url, shards)].append(entry)
+		for page in self.__pages:
+			random.shuffle(page)
+		if self.__pipeline:
+			for res in self.__results.results[result.Stage.EXTRACTION].success: # journaled extracted data
+				self.queue_validation(res, shard = -1)
+
+	def get_input_page(self, shard: int, page: int, size: int) -> list[input.InputGrouped]:
+		"""
+		Get a page of the input used for extraction or validation of the specified shard.\n
+		Returns an empty list past the last page.
+		"""
+		return self.__pages[shard][page * size:(page + 1) * size]
+
+	def get_input_count(self, shard: int):
+		"""
+		Get the number of unique URLs in the input of the specified shard.
+		"""
+		return len(self.__pages[shard]) - len(self.get_input_split(shard))
+
+	def get_input_split(self, shard: int) -> set[str]:
+		"""
+		Get the URLs of the specified shard which are input twice, once with and once without the browser.
+		"""
+		return self.__split if self.__shards <= 1 else {entry for entry in self.__split if url.get_shard(entry, self.__shards) == shard}
 
 	def has_input(self):
 		"""
 		Check if there is any input to be used for extraction or validation.
 		"""
-		return bool(self.get_input())
+		return bool(self.__input)
 
-	def append_error(self, result: result.Result | result.ResultPlaintext):
+	def append_error(self, res: result.Result | result.ResultPlaintext, stage: result.Stage | None = None, keys: list[str] = []):
 		"""
-		Append a result to the error list.
+		Append a result to the error list of the specified stage, or of the current stage if not specified.\n
+		Results are journaled along with the keys used, if any, and written to the live output file, if specified.
 		"""
-		self.__results.results[self.__stage].error.append(result)
+		self.__results.results[stage or self.__stage].error.append(res)
+		self.__journal.write(stage or self.__stage, journal.ERROR, keys, res)
+		if self.__live:
+			self.__live.write(stage or self.__stage, journal.ERROR, res)
 
 	def get_error(self):
 		"""
@@ -71,11 +222,21 @@ class Shared:
 		"""
 		return bool(self.get_error())
 
-	def append_success(self, result: result.Result | result.ResultPlaintext):
+	def append_success(self, res: result.Result | result.ResultPlaintext, stage: result.Stage | None = None, keys: list[str] = []):
+		"""
+		Append a result to the success list of the specified stage, or of the current stage if not specified.\n
+		Results are journaled along with the keys used, if any, and written to the live output file, if specified.
+		"""
+		self.__results.results[stage or self.__stage].success.append(res)
+		self.__journal.write(stage or self.__stage, journal.SUCCESS, keys, res)
+		if self.__live:
+			self.__live.write(stage or self.__stage, journal.SUCCESS, res)
+
+	def append_no_results(self, res: result.Result | result.ResultPlaintext, stage: result.Stage | None = None, keys: list[str] = []):
 		"""
-		Append a result to the success list.
+		Journal a request or a plaintext file without results, so it is skipped if resuming.
 		"""
-		self.__results.results[self.__stage].success.append(result)
+		self.__journal.write(stage or self.__stage, journal.NO_RESULTS, keys, res)
 
 	def get_success(self):
 		"""
@@ -97,24 +258,20 @@ class Shared:
 
 	def require_playwright(self):
 		"""
-		Check if Playwright's headless browser is required and set the browser wait time to zero.\n
-		Applies only for validation.\n
-		Returns `True` if required and `0`.
-		"""
-		playwright, playwright_wait = False, 0
-		for value in self.__template.entries.values():
-			if value.validate_browser:
-				playwright = True
-				break
-		return playwright, playwright_wait
-
-	def get_playwright(self, key: str):
-		"""
-		Check if Playwright's headless browser is required and get the browser wait time for the specified key.\n
+		Check if Playwright's headless browser is required by any input and set the browser wait time to zero, without a wait condition.\n
 		Applies only for validation.\n
-		Returns `True` if required and the browser wait time.
+		In the pipeline mode, the input is not known in advance, so checks if it is required by any template entry with the `validate` RegEx.\n
+		Returns `True` if required, `0`, and an empty string.
 		"""
-		return self.__template.entries[key].validate_browser, self.__template.entries[key].validate_browser_wait
+		playwright, playwright_wait, playwright_wait_until = False, 0, ""
+		if self.__pipeline and not self.is_validation_started():
+			playwright = any(value.validate and value.validate_browser for value in self.__template.entries.values())
+		else:
+			for entry in self.__input:
+				if self.__snapshot.get(entry.keys).playwright:
+					playwright = True
+					break
+		return playwright, playwright_wait, playwright_wait_until
 
 	def parse_template(self):
 		"""
@@ -125,92 +282,81 @@ class Shared:
 		for key in list(self.__template.entries.keys()):
 			if (self.__stage == result.Stage.EXTRACTION and not self.__template.entries[key].extract) or (self.__stage == result.Stage.VALIDATION and not self.__template.entries[key].validate):
 				self.__template.entries.pop(key)
+		self.__matchers[self.__stage] = matcher.Matcher(self.__template, self.__excludes, self.is_validation_started(), self.__debug)
+		self.__snapshot = snapshot.Snapshot(self.__template)
 		return bool(self.__template.entries)
 
+	def get_snapshot(self):
+		"""
+		Get the read-only snapshot of the template's validation settings.\n
+		Call this once per process and look up the settings locally.
+		"""
+		return self.__snapshot
+
+	def get_matcher(self, stage: result.Stage | None = None):
+		"""
+		Get the matcher for the specified stage, or for the current stage if not specified.\n
+		Call this once per process and match locally; only the matches should be shared.
+		"""
+		return self.__matchers[stage or self.__stage]
+
 	def parse_input(self):
 		"""
-		Parse the input used for extraction or validation.
+		Parse the input used for extraction or validation.\n
+		Plaintext files are not parsed here, they are scanned by the plaintext engine during extraction.\n
+		The input is parsed and grouped by URL incrementally, so only the grouped input is held in memory.
+		"""
+		self.__input = jquery.group_by_url(self.__iterate_input())
+		self.__split = set()
+		if self.is_validation_started():
+			self.__input = self.__split_by_playwright(self.__input, self.__split)
+		if self.__processed:
+			self.__input = [entry for entry in self.__input if not self.__is_processed(entry, self.__stage)]
+		return self.has_input() or self.has_success() # journaled results
+
+	def __iterate_input(self) -> typing.Iterator[input.Input]:
+		"""
+		Iterate over the input used for extraction or validation, one URL at a time.
 		"""
-		tmp = []
 		if not self.is_validation_started():
-			if not self.__plaintext:
-				for path in self.__input:
-					chad_results, message = input.deserialize_chad_results(file.read(path))
-					if message:
-						if self.__debug:
-							general.print_red(f"{message} from \"{path}\"")
-					else:
-						for url in jquery.select_urls(chad_results):
-							tmp.append(input.Input(url, "", path))
-			else:
-				for path in self.__input:
-					results = self.parse_response(content = file.read(path)) # plaintext files are treated like server responses
-					if results:
-						self.append_success(result.ResultPlaintext(path, results))
-				return self.has_success()
+			for path in self.__input:
+				try:
+					for chad_results in input.iterate_chad_results(file.read_chunks(path)):
+						for url in chad_results.urls:
+							yield input.Input(url, "", path)
+				except ValueError:
+					if self.__debug:
+						general.print_red(f"Cannot deserialize Chad results from \"{path}\"")
 		else:
-			if not self.__plaintext:
-				for entry in self.__results.results[result.Stage.EXTRACTION].success: # extracted data
-					for key in entry.results:
-						if key in self.__template.entries:
-							for url in entry.results[key]:
+			for entry in self.__results.results[result.Stage.EXTRACTION].success: # extracted data
+				for key in entry.results:
+					if key in self.__template.entries:
+						for url in entry.results[key]:
+							if not self.__plaintext:
 								for path in entry.files:
-									tmp.append(input.Input(url, key, path))
-			else:
-				for entry in self.__results.results[result.Stage.EXTRACTION].success: # extracted data
-					for key in entry.results:
-						if key in self.__template.entries:
-							for url in entry.results[key]:
-								tmp.append(input.Input(url, key, entry.file))
-		self.__input = jquery.group_by_url(tmp)
-		return self.has_input()
+									yield input.Input(url, key, path)
+							else:
+								yield input.Input(url, key, entry.file)
 
-	def parse_response(self, content: str, key = "") -> dict[str, list[str]] | bool:
+	def __split_by_playwright(self, obj: list[input.InputGrouped], split: set[str] | None = None) -> list[input.InputGrouped]:
 		"""
-		Parse an HTTP response content as a result of extraction or validation.
+		Split the keys of each URL by whether Playwright's headless browser is required, so only the keys which require it are validated in the browser.\n
+		If specified, the URLs input twice are added to `split`.\n
+		Returns at most two entries per URL.
 		"""
-		tmp = {}
-		try:
-			if not self.is_validation_started():
-				if self.__excludes:
-					for query in self.__excludes:
-						content = re.sub(query, "", content, flags = self.__flags)
-				for key, value in self.__template.entries.items():
-					matches = re.findall(value.extract, content, flags = self.__flags)
-					if matches:
-						if value.extract_prepend or value.extract_append:
-							for i in range(len(matches)):
-								matches[i] = value.extract_prepend + matches[i] + value.extract_append
-						tmp[key] = array.unique(matches, sort = True)
-			elif re.search(self.__template.entries[key].validate, content, flags = self.__flags):
-				tmp = True
-		except (re.error, KeyError) as ex:
-			if self.__debug:
-				general.print_red(str(ex))
+		tmp = []
+		for entry in obj:
+			browser = [key for key in entry.keys if self.__template.entries[key].validate_browser]
+			plain   = [key for key in entry.keys if not self.__template.entries[key].validate_browser]
+			if browser and plain and split is not None:
+				split.add(entry.url)
+			for keys in [plain, browser]:
+				if keys:
+					tmp.append(input.InputGrouped(entry.url, keys, entry.files))
 		return tmp
 
-	def get_headers(self, key = "", with_cookies = False) -> dict[str, str]:
+	def parse_response(self, content: str, keys: list[str] = []) -> dict[str, list[str]] | list[str]:
 		"""
-		Get validation HTTP request headers for the specified key.\n
-		Returns an empty dictionary if the specified key does not exist or is empty.
-		"""
-		headers = {}
-		if key and key in self.__template.entries:
-			for name, value in self.__template.entries[key].validate_headers.items():
-				headers[name.lower()] = value
-			if with_cookies:
-				cookies = self.get_cookies(key)
-				if cookies:
-					headers["cookie"] = ("; ").join(f"{name}={value}" for name, value in cookies.items()) # for APIRequestContext.get()
-		return headers
-
-	def get_cookies(self, key = "") -> dict[str, str]:
-		"""
-		Get validation HTTP cookies for the specified key.\n
-		Returns an empty dictionary if the specified key does not exist or is empty.
+		Parse an HTTP response content as a result of extraction or validation.
 		"""
-		cookies = {}
-		if key and key in self.__template.entries:
-			for name, value in self.__template.entries[key].validate_cookies.items():
-				cookies[name.lower()] = value
-		return cookies
+		return self.get_matcher().parse_response(content, keys)
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from . import literal
+
 import dataclasses, json
 
 @dataclasses.dataclass
@@ -7,14 +9,16 @@ class TemplateEntry:
 	"""
 	Class for storing a single entry of Chad Extractor template.
 	"""
-	extract              : str
-	extract_prepend      : str            = ""
-	extract_append       : str            = ""
-	validate             : str            = ""
-	validate_browser     : bool           = False
-	validate_browser_wait: float          = 0
-	validate_headers     : dict[str, str] = dataclasses.field(default_factory = dict)
-	validate_cookies     : dict[str, str] = dataclasses.field(default_factory = dict)
+	extract                    : str
+	extract_prepend            : str            = ""
+	extract_append             : str            = ""
+	validate                   : str            = ""
+	validate_browser           : bool           = False
+	validate_browser_wait      : float          = 0
+	validate_browser_wait_until: str            = ""
+	validate_headers           : dict[str, str] = dataclasses.field(default_factory = dict)
+	validate_cookies           : dict[str, str] = dataclasses.field(default_factory = dict)
+	extract_literals           : list[str]      = dataclasses.field(default_factory = list, init = False) # derived from the extract RegEx
 
 @dataclasses.dataclass
 class Template:
@@ -28,6 +32,7 @@ class Template:
 def deserialize(template_json: str) -> tuple[Template | None, str]:
 	"""
 	Deserialize a Chad Extractor template from a JSON string.\n
+	The literals required by each extract RegEx are derived as well, so matching can skip entries whose literals are not in the content.\n
 	Returns `None` and an error message on failure.
 	"""
 	template = Template()
@@ -36,6 +41,7 @@ def deserialize(template_json: str) -> tuple[Template | None, str]:
 		tmp = json.loads(template_json)
 		for key in tmp.keys():
 			template.entries[key] = TemplateEntry(**tmp[key])
+			template.entries[key].extract_literals = literal.get_required(template.entries[key].extract)
 	except Exception:
 		template = None
 		message = "Cannot deserialize the template"
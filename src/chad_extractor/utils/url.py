@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-import urllib.parse
+import urllib.parse, zlib
 
 __URL_SCHEME_WHITELIST = ["http", "https", "socks4", "socks4h", "socks5", "socks5h"]
 __MIN_PORT_NUM         = 1
@@ -30,3 +30,10 @@ def normalize(url: str):
 	Normalize a URL.
 	"""
 	return urllib.parse.urlsplit(url).geturl()
+
+def get_shard(url: str, shards: int):
+	"""
+	Get the shard of a URL by its domain name, so all URLs of the same domain name end up in the same shard.\n
+	Stable across processes, unlike the built-in `hash()`.
+	"""
+	return zlib.crc32((urllib.parse.urlsplit(url).hostname or "").encode()) % shards if shards > 1 else 0
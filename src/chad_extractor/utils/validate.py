@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from . import config, directory, file, general, grep, template, url
+from . import config, directory, file, general, grep, template, url, wait
 
-import argparse, nagooglesearch, sys
+import argparse, nagooglesearch, os, sys
 
 class MyArgParser(argparse.ArgumentParser):
 
@@ -24,18 +24,60 @@ class MyArgParser(argparse.ArgumentParser):
 		print("PLAINTEXT")
 		print("    Treat all the results as plaintext files / server responses")
 		print("    -pt, --plaintext")
+		print("CHUNK SIZE")
+		print("    Size of the chunks to scan plaintext files in, in megabytes")
+		print("    Memory usage is bounded by the chunk size instead of the file size")
+		print("    Applies only for plaintext files")
+		print("    Default: 64")
+		print("    -cs, --chunk-size = 16 | 256 | etc.")
+		print("CHUNK OVERLAP")
+		print("    Number of bytes each chunk is extended by on both sides, so data crossing chunk boundaries is still extracted")
+		print("    Data longer than the overlap might be missed")
+		print("    Applies only for plaintext files")
+		print("    Default: 4096")
+		print("    -co, --chunk-overlap = 1024 | 65536 | etc.")
+		print("OFFSETS")
+		print("    Include the byte offsets of all occurrences of the extracted data in the output file")
+		print("    Applies only for plaintext files")
+		print("    -of, --offsets")
+		print("PIPELINE")
+		print("    Validate the extracted data in the same crawl, as soon as it is extracted")
+		print("    Does not apply for plaintext files")
+		print("    -pl, --pipeline")
 		print("EXCLUDES")
 		print("    File containing regular expressions or a single regular expression to exclude content from the page")
 		print("    Applies only for extraction")
 		print("    -e, --excludes = regexes.txt | \"<div id=\\\"seo\\\">.+?<\\/div>\" | etc.")
 		print("PLAYWRIGHT")
 		print("    Use Playwright's headless browser")
+		print("    If 'auto', fetch the page over plain HTTP first, and render it in the headless browser only if no data was extracted, the page is a JavaScript shell, or a marker was found")
 		print("    Applies only for extraction")
-		print("    -p, --playwright")
+		print("    -p, --playwright = auto")
+		print("PLAYWRIGHT MARKERS")
+		print("    File containing regular expressions or a single regular expression which, if found in the page, requires the page to be rendered in the headless browser")
+		print("    Applies only for '-p auto'")
+		print("    -pm, --playwright-markers = regexes.txt | \"Please enable JavaScript\" | etc.")
 		print("PLAYWRIGHT WAIT")
 		print("    Wait time in seconds before fetching the page content")
+		print("    If a wait condition is specified, maximum wait time for the condition to be met")
 		print("    Applies only for extraction")
 		print("    -pw, --playwright-wait = 0.5 | 2 | 4 | etc.")
+		print("PLAYWRIGHT WAIT UNTIL")
+		print("    Wait condition before fetching the page content")
+		print("    Use 'regex' to wait until any extraction RegEx matches the page content")
+		print("    If no wait time is specified, the request timeout is used as the maximum wait time")
+		print("    Applies only for extraction")
+		print("    -pwu, --playwright-wait-until = networkidle | \"selector:#content\" | regex | etc.")
+		print("PLAYWRIGHT CONTEXTS")
+		print("    Maximum number of Playwright's browser contexts assigned new pages")
+		print("    Requests with the same headers and cookies share a context")
+		print("    This is a soft limit - a replaced context stays open until its pages are done")
+		print("    Default: 5")
+		print("    -pc, --playwright-contexts = 2 | 10 | etc.")
+		print("PLAYWRIGHT PAGES")
+		print("    Number of pages after which Playwright's browser context is replaced")
+		print("    Default: 50")
+		print("    -pp, --playwright-pages = 20 | 100 | etc.")
 		print("CONCURRENT REQUESTS")
 		print("    Number of concurrent requests")
 		print("    Default: 15")
@@ -62,6 +104,17 @@ class MyArgParser(argparse.ArgumentParser):
 		print("    Request timeout in seconds")
 		print("    Default: 60")
 		print("    -rt, --request-timeout = 30 | 90 | etc.")
+		print("WORKERS")
+		print("    Number of worker processes to match the page content in")
+		print("    If zero, the page content is matched in the crawler process")
+		print("    In the plaintext mode, number of worker processes to scan the files in, largest first")
+		print("    Default: 0")
+		print("    -w, --workers = 4 | 8 | etc.")
+		print("PROCESSES")
+		print("    Number of crawler processes to split the URLs between by domain name")
+		print("    Concurrent requests, browser contexts, and worker processes are split between them")
+		print("    Default: 1")
+		print("    -pr, --processes = 2 | 4 | etc.")
 		print("USER AGENTS")
 		print("    User agents to use")
 		print("    Default: random-all")
@@ -72,6 +125,14 @@ class MyArgParser(argparse.ArgumentParser):
 		print("OUT")
 		print("    Output file")
 		print("    -o, --out = report.json | etc.")
+		print("OUT LIVE")
+		print("    Output file to which each result is appended as soon as it is produced, one JSON object per line")
+		print("    -ol, --out-live = results.jsonl | etc.")
+		print("RESUME")
+		print("    Resume an interrupted run, skipping the URLs or plaintext files which were already processed")
+		print(f"    Every processed URL or plaintext file is written to a journal next to the output file, ending with '{config.JOURNAL_EXTENSION}'")
+		print("    The journal is removed once the run is complete and the results have been saved")
+		print("    -re, --resume")
 		print("VERBOSE")
 		print(f"    Create additional supporting output files that end with '{config.REPORT_EXTENSION}'")
 		print("    -v, --verbose")
@@ -81,7 +142,7 @@ class MyArgParser(argparse.ArgumentParser):
 
 	def error(self, message):
 		if len(sys.argv) > 1:
-			print("Missing a mandatory option (-t, -res, -o) and/or optional (-pt, -e, -p, -pw, -cr, -crd, -s, -rs, -at, -r, -rt, -a, -x, -v, -dbg)")
+			print("Missing a mandatory option (-t, -res, -o) and/or optional (-pt, -cs, -co, -of, -pl, -e, -p, -pm, -pw, -pwu, -pc, -pp, -cr, -crd, -s, -rs, -at, -r, -rt, -w, -pr, -a, -x, -ol, -re, -v, -dbg)")
 			print("Use -h or --help for more info")
 		else:
 			self.print_help()
@@ -97,9 +158,17 @@ class Validate:
 		self.__parser.add_argument("-t"  , "--template"                  , required = True , type   = str         , default = ""   )
 		self.__parser.add_argument("-res", "--results"                   , required = True , type   = str         , default = ""   )
 		self.__parser.add_argument("-pt" , "--plaintext"                 , required = False, action = "store_true", default = False)
+		self.__parser.add_argument("-cs" , "--chunk-size"                , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-co" , "--chunk-overlap"             , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-of" , "--offsets"                   , required = False, action = "store_true", default = False)
+		self.__parser.add_argument("-pl" , "--pipeline"                  , required = False, action = "store_true", default = False)
 		self.__parser.add_argument("-e"  , "--excludes"                  , required = False, type   = str         , default = ""   )
-		self.__parser.add_argument("-p"  , "--playwright"                , required = False, action = "store_true", default = False)
+		self.__parser.add_argument("-p"  , "--playwright"                , required = False, type   = str         , default = ""   , nargs = "?", const = "on")
+		self.__parser.add_argument("-pm" , "--playwright-markers"        , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-pw" , "--playwright-wait"           , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-pwu", "--playwright-wait-until"     , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-pc" , "--playwright-contexts"       , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-pp" , "--playwright-pages"          , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-cr" , "--concurrent-requests"       , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-crd", "--concurrent-requests-domain", required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-s"  , "--sleep"                     , required = False, type   = str         , default = ""   )
@@ -107,9 +176,13 @@ class Validate:
 		self.__parser.add_argument("-at" , "--auto-throttle"             , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-r"  , "--retries"                   , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-rt" , "--request-timeout"           , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-w"  , "--workers"                   , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-pr" , "--processes"                 , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-a"  , "--user-agents"               , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-x"  , "--proxy"                     , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-o"  , "--out"                       , required = True , type   = str         , default = ""   )
+		self.__parser.add_argument("-ol" , "--out-live"                  , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-re" , "--resume"                    , required = False, action = "store_true", default = False)
 		self.__parser.add_argument("-v"  , "--verbose"                   , required = False, action = "store_true", default = False)
 		self.__parser.add_argument("-dbg", "--debug"                     , required = False, action = "store_true", default = False)
 
@@ -121,16 +194,27 @@ class Validate:
 		self.__args = self.__parser.parse_args()
 		self.__validate_template()
 		self.__validate_results()
+		self.__validate_chunk_size()
+		self.__validate_chunk_overlap()
+		self.__validate_pipeline()
 		self.__validate_excludes()
+		self.__validate_playwright()
+		self.__validate_playwright_markers()
 		self.__validate_playwright_wait()
+		self.__validate_playwright_wait_until()
+		self.__validate_playwright_contexts()
+		self.__validate_playwright_pages()
 		self.__validate_concurrent_requests()
 		self.__validate_concurrent_requests_domain()
 		self.__validate_sleep()
 		self.__validate_auto_throttle()
 		self.__validate_retries()
 		self.__validate_request_timeout()
+		self.__validate_workers()
+		self.__validate_processes()
 		self.__validate_user_agents()
 		self.__validate_proxy()
+		self.__validate_out_live()
 		return self.__success, self.__args
 
 	def __error(self, message: str):
@@ -158,6 +242,11 @@ class Validate:
 					tmp, message = template.deserialize(tmp)
 					if message:
 						self.__error(f"{message} from \"{self.__args.template}\"")
+					else:
+						for key, value in tmp.entries.items():
+							success, message = wait.validate(value.validate_browser_wait_until)
+							if not success:
+								self.__error(f"{message} for \"{key}\" from \"{self.__args.template}\"")
 		self.__args.template = tmp
 
 	def __validate_results(self):
@@ -182,6 +271,30 @@ class Validate:
 				tmp = [self.__args.results]
 		self.__args.results = tmp
 
+	def __validate_chunk_size(self):
+		tmp = 64
+		if self.__args.chunk_size:
+			if not self.__args.chunk_size.isdigit():
+				self.__error("Chunk size must be numeric")
+			else:
+				tmp = int(self.__args.chunk_size)
+				if tmp <= 0:
+					self.__error("Chunk size must be greater than zero")
+		self.__args.chunk_size = tmp * 1024 * 1024
+
+	def __validate_chunk_overlap(self):
+		tmp = 4096
+		if self.__args.chunk_overlap:
+			if not self.__args.chunk_overlap.isdigit():
+				self.__error("Chunk overlap must be numeric")
+			else:
+				tmp = int(self.__args.chunk_overlap)
+		self.__args.chunk_overlap = tmp
+
+	def __validate_pipeline(self):
+		if self.__args.pipeline and self.__args.plaintext:
+			self.__error("Pipeline mode does not apply for plaintext files")
+
 	def __validate_excludes(self):
 		tmp = []
 		if self.__args.excludes:
@@ -205,6 +318,44 @@ class Validate:
 					tmp = [self.__args.excludes]
 		self.__args.excludes = tmp
 
+	def __validate_playwright(self):
+		tmp = False
+		self.__args.playwright_auto = False
+		if self.__args.playwright:
+			lower = self.__args.playwright.lower()
+			if lower == "on":
+				tmp = True
+			elif lower == "auto":
+				self.__args.playwright_auto = True
+			else:
+				self.__error("Playwright's mode must be 'auto' or omitted")
+		self.__args.playwright = tmp
+
+	def __validate_playwright_markers(self):
+		tmp = []
+		if self.__args.playwright_markers:
+			if not self.__args.playwright_auto:
+				self.__error("Playwright's markers require Playwright's 'auto' mode")
+			elif file.is_file(self.__args.playwright_markers):
+				success, message = file.validate(self.__args.playwright_markers)
+				if not success:
+					self.__error(message)
+				else:
+					tmp = file.read_array(self.__args.playwright_markers)
+					if not tmp:
+						self.__error(f"No regular expressions were found in \"{self.__args.playwright_markers}\"")
+					else:
+						success, message = grep.validate_multiple(tmp)
+						if not success:
+							self.__error(message)
+			else:
+				success, message = grep.validate(self.__args.playwright_markers)
+				if not success:
+					self.__error(message)
+				else:
+					tmp = [self.__args.playwright_markers]
+		self.__args.playwright_markers = tmp
+
 	def __validate_playwright_wait(self):
 		tmp = 0
 		if self.__args.playwright_wait:
@@ -215,6 +366,34 @@ class Validate:
 				self.__error("Playwright's wait time must be greater than zero")
 		self.__args.playwright_wait = tmp
 
+	def __validate_playwright_wait_until(self):
+		if self.__args.playwright_wait_until:
+			success, message = wait.validate(self.__args.playwright_wait_until)
+			if not success:
+				self.__error(message)
+
+	def __validate_playwright_contexts(self):
+		tmp = 5
+		if self.__args.playwright_contexts:
+			if not self.__args.playwright_contexts.isdigit():
+				self.__error("Number of Playwright's browser contexts must be numeric")
+			else:
+				tmp = int(self.__args.playwright_contexts)
+				if tmp <= 0:
+					self.__error("Number of Playwright's browser contexts must be greater than zero")
+		self.__args.playwright_contexts = tmp
+
+	def __validate_playwright_pages(self):
+		tmp = 50
+		if self.__args.playwright_pages:
+			if not self.__args.playwright_pages.isdigit():
+				self.__error("Number of pages per Playwright's browser context must be numeric")
+			else:
+				tmp = int(self.__args.playwright_pages)
+				if tmp <= 0:
+					self.__error("Number of pages per Playwright's browser context must be greater than zero")
+		self.__args.playwright_pages = tmp
+
 	def __validate_concurrent_requests(self):
 		tmp = 15
 		if self.__args.concurrent_requests:
@@ -278,6 +457,26 @@ class Validate:
 				self.__error("Request timeout must be greater than zero")
 		self.__args.request_timeout = tmp
 
+	def __validate_workers(self):
+		tmp = 0
+		if self.__args.workers:
+			if not self.__args.workers.isdigit():
+				self.__error("Number of worker processes must be numeric")
+			else:
+				tmp = int(self.__args.workers)
+		self.__args.workers = tmp
+
+	def __validate_processes(self):
+		tmp = 1
+		if self.__args.processes:
+			if not self.__args.processes.isdigit():
+				self.__error("Number of crawler processes must be numeric")
+			else:
+				tmp = int(self.__args.processes)
+				if tmp <= 0:
+					self.__error("Number of crawler processes must be greater than zero")
+		self.__args.processes = tmp
+
 	def __validate_user_agents(self):
 		tmp = nagooglesearch.get_all_user_agents()
 		if self.__args.user_agents:
@@ -304,3 +503,7 @@ class Validate:
 			success, message = url.validate(self.__args.proxy)
 			if not success:
 				self.__error(message)
+
+	def __validate_out_live(self):
+		if self.__args.out_live and os.path.abspath(self.__args.out_live) == os.path.abspath(self.__args.out):
+			self.__error("Live output file must be different from the output file")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+from playwright.async_api import Page as PlaywrightPage, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+import asyncio, time, typing
+
+NETWORK_IDLE = "networkidle"
+SELECTOR     = "selector:"
+REGEX        = "regex"
+
+POLL_INTERVAL = 0.25 # seconds
+
+def validate(until: str):
+	"""
+	Validate a wait condition.
+	"""
+	success = True
+	message = ""
+	if until and until != NETWORK_IDLE and until != REGEX and not (until.startswith(SELECTOR) and until[len(SELECTOR):].strip()):
+		success = False
+		message = f"Wait condition must be '{NETWORK_IDLE}', '{SELECTOR}<css>', or '{REGEX}': {until}"
+	return success, message
+
+def merge(conditions: list[str]):
+	"""
+	Merge the wait conditions of multiple template entries.\n
+	Returns the only condition specified, or `networkidle` if different conditions are specified.
+	"""
+	tmp = set(condition for condition in conditions if condition)
+	return tmp.pop() if len(tmp) == 1 else NETWORK_IDLE if tmp else ""
+
+async def until(page: PlaywrightPage, condition: str, timeout: float, is_ready: typing.Callable[[str], typing.Awaitable[bool]]):
+	"""
+	Wait until the condition is met or the timeout in seconds is exceeded, and get the page content.\n
+	If no condition is specified, simply sleep for the timeout.\n
+	`regex` condition polls the page content until `is_ready` returns `True`.
+	"""
+	content = ""
+	try:
+		if not condition:
+			if timeout > 0:
+				await asyncio.sleep(timeout)
+		elif condition == NETWORK_IDLE:
+			await page.wait_for_load_state(NETWORK_IDLE, timeout = timeout * 1000)
+		elif condition.startswith(SELECTOR):
+			await page.wait_for_selector(condition[len(SELECTOR):].strip(), timeout = timeout * 1000)
+		elif condition == REGEX:
+			deadline = time.monotonic() + timeout
+			while True:
+				content = await page.content()
+				if await is_ready(content) or time.monotonic() >= deadline:
+					break
+				await asyncio.sleep(min(POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+				content = ""
+	except (PlaywrightError, PlaywrightTimeoutError):
+		pass # on timeout, take whatever has been rendered so far
+	return content or await page.content()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+from . import matcher, result
+
+from twisted.internet   import defer
+from scrapy.utils.defer import maybe_deferred_to_future
+
+import concurrent.futures
+
+worker_matchers: dict[result.Stage, matcher.Matcher] = {}
+
+def initialize(shared_matchers: dict[result.Stage, matcher.Matcher]):
+	"""
+	Store the matchers in the worker process.
+	"""
+	global worker_matchers
+	worker_matchers = shared_matchers
+
+def parse_response(content: str, keys: list[str], stage: result.Stage) -> dict[str, list[str]] | list[str]:
+	"""
+	Parse an HTTP response content in the worker process.
+	"""
+	return worker_matchers[stage].parse_response(content, keys)
+
+# ----------------------------------------
+
+class Pool:
+
+	def __init__(self, matchers: dict[result.Stage, matcher.Matcher], workers: int):
+		"""
+		Class for matching HTTP response contents in a pool of worker processes.\n
+		At most two contents per worker are in flight, the rest wait in Scrapy's scraper slot, which pauses the downloads once full.
+		"""
+		self.__executor  = concurrent.futures.ProcessPoolExecutor(max_workers = workers, initializer = initialize, initargs = (matchers,))
+		self.__semaphore = defer.DeferredSemaphore(workers * 2)
+
+	async def parse_response(self, content: str, keys: list[str], stage: result.Stage) -> dict[str, list[str]] | list[str]:
+		"""
+		Parse an HTTP response content as a result of extraction or validation without blocking the reactor.
+		"""
+		await maybe_deferred_to_future(self.__semaphore.acquire())
+		try:
+			return await maybe_deferred_to_future(self.__to_deferred(self.__executor.submit(parse_response, content, keys, stage)))
+		finally:
+			self.__semaphore.release()
+
+	def __to_deferred(self, future: concurrent.futures.Future) -> defer.Deferred:
+		"""
+		Wrap a future into a deferred which fires in the reactor thread.
+		"""
+		from twisted.internet import reactor # the reactor must not be installed on import
+		deferred = defer.Deferred()
+		def callback(future: concurrent.futures.Future):
+			if future.cancelled():
+				reactor.callFromThread(deferred.errback, defer.CancelledError())
+			elif future.exception():
+				reactor.callFromThread(deferred.errback, future.exception())
+			else:
+				reactor.callFromThread(deferred.callback, future.result())
+		future.add_done_callback(callback)
+		return deferred
+
+	def close(self):
+		"""
+		Shut down the worker processes.
+		"""
+		self.__executor.shutdown(wait = False, cancel_futures = True)
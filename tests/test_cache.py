@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+from chad.utils import cache, config
+
+import json, time
+
+RESULT = {"query": "q", "proxy": "", "urls": ["https://a.com"]}
+
+def test_round_trip(tmp_path):
+	path = str(tmp_path / "cache.json")
+	tmp  = cache.Cache(path, 1, False)
+	tmp.set("q", "", 100, "requests", RESULT)
+	assert tmp.get("q", "", 100, "requests") == RESULT
+	assert tmp.get("q", "", 100, "playwright") is None
+	tmp.save()
+	assert cache.Cache(path, 1, False).get("q", "", 100, "requests") == RESULT
+	assert cache.Cache(path, 1, True).get("q", "", 100, "requests") is None
+
+def test_saves_in_batches(tmp_path):
+	path = tmp_path / "cache.json"
+	tmp  = cache.Cache(str(path), 1, False)
+	for i in range(config.CACHE_SAVE_EVERY - 1):
+		tmp.set(f"q{i}", "", 100, "requests", RESULT)
+	assert not path.exists()
+	tmp.set("last", "", 100, "requests", RESULT)
+	assert len(json.loads(path.read_text(encoding = "UTF-8"))) == config.CACHE_SAVE_EVERY
+	assert not (tmp_path / "cache.json.tmp").exists()
+
+def test_expired_and_malformed_entries(tmp_path):
+	path = tmp_path / "cache.json"
+	tmp  = cache.Cache(str(path), 1, False)
+	tmp.set("q", "", 100, "requests", RESULT)
+	tmp.save()
+	entries = json.loads(path.read_text(encoding = "UTF-8"))
+	key     = next(iter(entries))
+	entries["expired"  ] = dict(entries[key], cached_at = time.time() - 3601)
+	entries["string"   ] = dict(entries[key], cached_at = "now")
+	entries["boolean"  ] = dict(entries[key], cached_at = True)
+	entries["missing"  ] = {"result": RESULT}
+	entries["not_dict" ] = ["not", "a", "dict"]
+	path.write_text(json.dumps(entries), encoding = "UTF-8")
+	tmp = cache.Cache(str(path), 1, False)
+	assert tmp.get("q", "", 100, "requests") == RESULT
+	tmp.set("q2", "", 100, "requests", RESULT)
+	tmp.save()
+	assert len(json.loads(path.read_text(encoding = "UTF-8"))) == 2
+
+def test_expired_result_is_ignored(tmp_path):
+	tmp = cache.Cache(str(tmp_path / "cache.json"), 0, False)
+	tmp.set("q", "", 100, "requests", RESULT)
+	assert tmp.get("q", "", 100, "requests") is None
+
+def test_invalid_file(tmp_path):
+	path = tmp_path / "cache.json"
+	for content in ["", "not json", "[]"]:
+		path.write_text(content, encoding = "UTF-8")
+		assert cache.Cache(str(path), 1, False).get("q", "", 100, "requests") is None
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+from chad_extractor.utils import input
+
+import json, pytest
+
+ENTRIES = [
+	{"query": "q1", "proxy": ""            , "urls": ["https://a.com", "https://b.com"]},
+	{"query": "q2", "proxy": "http://p:8080", "urls": []                              },
+	{"query": "q3", "proxy": ""            , "urls": ["https://c.com"]                }
+]
+
+def chunked(string, size):
+	return (string[i:i + size] for i in range(0, len(string), size))
+
+@pytest.mark.parametrize("string", [
+	json.dumps(ENTRIES),
+	json.dumps(ENTRIES, indent = 4),
+	"\n".join(json.dumps(entry) for entry in ENTRIES) + "\n"
+])
+@pytest.mark.parametrize("size", [1, 2, 7, 1024])
+def test_iterate_chad_results(string, size):
+	assert list(input.iterate_chad_results(chunked(string, size))) == [input.ChadResults(**entry) for entry in ENTRIES]
+
+@pytest.mark.parametrize("size", [1, 1024])
+def test_empty_array(size):
+	assert list(input.iterate_chad_results(chunked(" [ ] \n", size))) == []
+
+@pytest.mark.parametrize("string", [
+	"",
+	"   \n\t",
+	"[",
+	"[{\"query\": \"q1\"}",
+	"[{\"query\": \"q1\"} {\"query\": \"q2\"}]",
+	"[{\"query\": \"q1\"},]",
+	"[,{\"query\": \"q1\"}]",
+	"[{\"query\": \"q1\"},,{\"query\": \"q2\"}]",
+	"[{\"query\": \"q1\"}] {\"query\": \"q2\"}",
+	"[{\"query\": \"q1\"}, 1]",
+	"{\"query\": \"q1\"}\n{\"query\": ",
+	"{\"unknown\": \"q1\"}"
+])
+@pytest.mark.parametrize("size", [1, 1024])
+def test_malformed(string, size):
+	with pytest.raises(ValueError):
+		list(input.iterate_chad_results(chunked(string, size)))
+
+def test_malformed_keeps_previous_entries():
+	entries = []
+	with pytest.raises(ValueError):
+		for entry in input.iterate_chad_results(chunked(json.dumps(ENTRIES[:2])[:-1] + " " + json.dumps(ENTRIES[2]) + "]", 5)):
+			entries.append(entry)
+	assert entries == [input.ChadResults(**entry) for entry in ENTRIES[:2]]
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+from chad_extractor.utils import journal, plaintext, result, storage, template
+
+import json, pickle
+
+def get_template():
+	tmp, message = template.deserialize(json.dumps({"email": {"extract": r"[\w.]+@example\.com"}}))
+	assert tmp, message
+	return tmp
+
+def test_round_trip(tmp_path):
+	path = str(tmp_path / "out.journal.jsonl")
+	tmp = journal.Journal(path, False)
+	tmp.write(result.Stage.EXTRACTION, journal.SUCCESS, [], result.Result("https://a.com", ["a.json"], {"email": ["x@example.com"]}))
+	tmp.write(result.Stage.VALIDATION, journal.ERROR, ["email"], result.Result("https://b.com", ["b.json"]))
+	tmp.write(result.Stage.EXTRACTION, journal.NO_RESULTS, [], result.ResultPlaintext("c.txt"))
+	tmp.write(result.Stage.EXTRACTION, journal.SUCCESS, [], result.ResultPlaintext("d.txt", {"email": ["y@example.com"]}, {"email": {"y@example.com": [3]}}))
+	with open(path, "a", encoding = "UTF-8") as stream:
+		stream.write('{"stage": "extraction", "status"') # truncated by a crash
+	records = journal.Journal(path, True).read()
+	assert [(record.stage, record.status, record.keys) for record in records] == [
+		(result.Stage.EXTRACTION, journal.SUCCESS   , []       ),
+		(result.Stage.VALIDATION, journal.ERROR     , ["email"]),
+		(result.Stage.EXTRACTION, journal.NO_RESULTS, []       ),
+		(result.Stage.EXTRACTION, journal.SUCCESS   , []       )
+	]
+	assert records[0].result == result.Result("https://a.com", ["a.json"], {"email": ["x@example.com"]})
+	assert records[3].result == result.ResultPlaintext("d.txt", {"email": ["y@example.com"]}, {"email": {"y@example.com": [3]}})
+	appended = pickle.loads(pickle.dumps(journal.Journal(path, True))) # as sent to the shared storage process
+	appended.write(result.Stage.EXTRACTION, journal.SUCCESS, [], result.Result("https://e.com", ["e.json"]))
+	assert len(journal.Journal(path, True).read()) == 5 # not appended to the truncated record
+
+def test_not_resuming_removes_journal(tmp_path):
+	path = str(tmp_path / "out.journal.jsonl")
+	journal.Journal(path, False).write(result.Stage.EXTRACTION, journal.SUCCESS, [], result.Result("https://a.com", ["a.json"]))
+	assert not journal.Journal(path, False).read()
+	assert not journal.Journal(path, True).read()
+
+def test_remove(tmp_path):
+	path = tmp_path / "out.journal.jsonl"
+	tmp = journal.Journal(str(path), False)
+	tmp.write(result.Stage.EXTRACTION, journal.SUCCESS, [], result.Result("https://a.com", ["a.json"]))
+	tmp.remove()
+	assert not path.exists()
+
+def test_resume_skips_journaled_urls(tmp_path):
+	results = tmp_path / "results.json"
+	results.write_text(json.dumps([{"query": "q", "urls": ["https://a.com", "https://b.com", "https://c.com"]}]), encoding = "UTF-8")
+	path = str(tmp_path / "out.journal.jsonl")
+	journal.Journal(path, False).write(result.Stage.EXTRACTION, journal.SUCCESS, [], result.Result("https://b.com", [str(results)], {"email": ["x@example.com"]}))
+	shared = storage.Shared(get_template(), [str(results)], False, [], journal.Journal(path, True), None, False)
+	assert shared.parse_template()
+	assert shared.parse_input()
+	shared.start_shards(1)
+	assert sorted(entry.url for entry in shared.get_input_page(0, 0, 10)) == ["https://a.com", "https://c.com"]
+	assert [entry.url for entry in shared.get_success()] == ["https://b.com"]
+
+def test_resume_skips_journaled_plaintext_files(tmp_path):
+	files = []
+	for i, content in enumerate(["a@example.com", "nothing here", "b@example.com c@example.com"]):
+		files.append(str(tmp_path / f"{i}.txt"))
+		(tmp_path / f"{i}.txt").write_text(content, encoding = "UTF-8")
+	path = str(tmp_path / "out.journal.jsonl")
+	shared = storage.Shared(get_template(), files, True, [], journal.Journal(path, False), None, False)
+	assert shared.parse_template()
+	assert plaintext.Engine(shared, files, 1024, 64, False, 0, False).run()
+	expected = sorted(shared.get_success(), key = lambda entry: entry.file)
+	assert len(journal.Journal(path, True).read()) == 3 # including the file without results
+	shared = storage.Shared(get_template(), files, True, [], journal.Journal(path, True), None, False)
+	assert shared.parse_template()
+	for file in files:
+		assert shared.is_file_processed(file)
+	assert plaintext.Engine(shared, files + [files[0]], 1024, 64, False, 0, False).run()
+	assert sorted(shared.get_success(), key = lambda entry: entry.file) == expected
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+from chad.utils import limiter
+
+import pytest
+
+class Clock:
+
+	def __init__(self):
+		self.now = 100.0
+
+	def __call__(self):
+		return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+	tmp = Clock()
+	monkeypatch.setattr(limiter.time, "monotonic", tmp)
+	return tmp
+
+def test_budget_is_sent_back_to_back(clock):
+	tmp = limiter.Limiter(10, 10, 3)
+	assert [tmp.reserve("a") for _ in range(3)] == [0, 0, 0]
+	assert tmp.reserve("a") == 10 # since the first request
+	assert tmp.reserve("a") == 10
+	assert tmp.reserve("a") == 10
+	assert tmp.reserve("a") == 20 # since the fourth request, scheduled 10 seconds from now
+
+def test_keys_are_independent(clock):
+	tmp = limiter.Limiter(5, 5, 1)
+	assert tmp.reserve("a") == 0
+	assert tmp.reserve("b") == 0
+	assert tmp.reserve("a") == 5
+	assert tmp.reserve("") == 0
+
+def test_elapsed_time_counts_toward_the_wait(clock):
+	tmp = limiter.Limiter(10, 10, 1)
+	assert tmp.reserve("a") == 0
+	clock.now += 4
+	assert tmp.reserve("a") == 6
+	clock.now += 30
+	assert tmp.reserve("a") == 0
+
+def test_release_counts_the_wait_from_the_end(clock):
+	tmp = limiter.Limiter(10, 10, 1)
+	assert tmp.reserve("a") == 0
+	clock.now += 7 # e.g., a Google query with multiple pages
+	tmp.release("a")
+	assert tmp.reserve("a") == 10
+	tmp.release("unknown")
+
+def test_random_wait_is_within_bounds(clock):
+	tmp  = limiter.Limiter(2, 4, 1)
+	last = tmp.reserve("a")
+	for _ in range(50):
+		wait = tmp.reserve("a")
+		assert 2 <= wait - last <= 4
+		last = wait
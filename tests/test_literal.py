@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+from chad_extractor.utils import literal, matcher, template
+
+import json, pytest, random, regex as re
+
+FLAGS = re.MULTILINE | re.IGNORECASE
+
+def admits(query: str, text: str):
+	"""
+	Returns `True` if the literal prefilter lets the text through to the RegEx query.
+	"""
+	required = literal.get_required(query, min_length = 1)
+	return not required or any(entry.casefold() in text.casefold() for entry in required)
+
+@pytest.mark.parametrize("query, text", [
+	(r"(?:abcd){e<=1}"        , "abxd"          ),
+	(r"abcd{e<=1}"            , "abcx"          ),
+	(r"\b{0,2}a{2}"           , "aa"            ),
+	(r"(?=ab)?xyz"            , "xyz"           ),
+	(r"^{0,1}abc"             , "abc"           ),
+	(r"x{,2}abc"              , "abc"           ),
+	(r"abc{2,}def"            , "abccdef"       ),
+	(r"(?:foo|bar)baz"        , "barbaz"        ),
+	(r"(?!foo)bar"            , "bar"           ),
+	(r"(?#comment)hello"      , "hello"         ),
+	(r"[{]abc"                , "{abc"          ),
+	(r"\{abc"                 , "{abc"          ),
+	(r"https?://t\.me/\w+"    , "http://t.me/x" ),
+	(r"(?i)ABC"               , "abc"           )
+])
+def test_prefilter_admits_matching_text(query: str, text: str):
+	assert re.findall(query, text, flags = FLAGS)
+	assert admits(query, text)
+
+def test_prefilter_admits_random_text():
+	queries = [
+		r"ab+c", r"a(?:bc|cb)a", r"(?:abc){e<=1}", r"\b{0,2}ab", r"(?=ab)?ba", r"a.c", r"(?:ab)?c{2}", r"[ab]c|ca",
+		r"(?<=a)bc", r"(?<!a)bc", r"a{2,3}b", r"(a|)bc", r"abc|b", r"(?>ab|a)c", r"\Bab\b", r"ab*c+a?"
+	]
+	generator = random.Random(1)
+	for query in queries:
+		for _ in range(2000):
+			text = ("").join(generator.choice("abc ") for _ in range(generator.randint(0, 10)))
+			if re.findall(query, text, flags = FLAGS):
+				assert admits(query, text), (query, text)
+
+def test_matcher_finds_fuzzy_matches():
+	tmp, message = template.deserialize(json.dumps({"fuzzy": {"extract": r"(?:abcd){e<=1}"}}))
+	assert tmp, message
+	assert tmp.entries["fuzzy"].extract_literals == []
+	results = matcher.Matcher(tmp, [], False, False).parse_response("xx abxd xx")
+	assert results["fuzzy"] == sorted(re.findall(r"(?:abcd){e<=1}", "xx abxd xx", flags = FLAGS))
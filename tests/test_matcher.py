@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+from chad_extractor.utils import array, matcher, template
+
+import json, pytest, random, regex as re
+
+FLAGS = re.MULTILINE | re.IGNORECASE
+
+def get_matcher(entries: dict[str, dict[str, str]], excludes: list[str] = [], validation: bool = False):
+	tmp, message = template.deserialize(json.dumps(entries))
+	assert tmp, message
+	return matcher.Matcher(tmp, excludes, validation, False)
+
+def search_gaps(query: str, excludes: list[str], content: str) -> list:
+	"""
+	Reference implementation, search each gap between the excluded spans on its own.
+	"""
+	gaps = []
+	last = 0
+	if excludes:
+		for match in re.finditer(f"(?|{('|').join(f'(?:{entry})' for entry in excludes)})", content, flags = FLAGS):
+			if match.start() > last:
+				gaps.append((last, match.start()))
+			last = match.end()
+	if last < len(content) or not gaps:
+		gaps.append((last, len(content)))
+	compiled = re.compile(query, flags = FLAGS)
+	return [match for start, end in gaps for match in compiled.findall(content, start, end)]
+
+def test_parse_response():
+	tmp = get_matcher({
+		"email": {"extract": r"[\w.]+@example\.com", "extract_prepend": "mailto:"},
+		"phone": {"extract": r"\+\d{3} \d{3}"}
+	})
+	assert tmp.parse_response("a@example.com, b@example.com, a@example.com") == {"email": ["mailto:a@example.com", "mailto:b@example.com"]}
+	assert tmp.parse_response("nothing here") == {}
+
+def test_parse_response_validation():
+	tmp = get_matcher({
+		"email": {"extract": r"[\w.]+@example\.com", "validate": "Welcome"},
+		"phone": {"extract": r"\d+"                , "validate": "Goodbye"}
+	}, validation = True)
+	assert tmp.parse_response("Welcome back!", ["email", "phone"]) == ["email"]
+	assert tmp.parse_response("Welcome back!", ["phone"]) == []
+
+def test_match_crossing_excluded_span():
+	tmp = get_matcher({"word": {"extract": r"x+a?b?"}}, ["E"])
+	assert tmp.parse_response("xExxab") == {"word": array.unique(search_gaps(r"x+a?b?", ["E"], "xExxab"), sort = True)}
+	assert tmp.parse_response("xExxab") == {"word": ["x", "xxab"]}
+
+def test_excluded_content_is_not_matched():
+	tmp = get_matcher({"email": {"extract": r"[\w.]+@example\.com"}}, [r"<!--.*?-->"])
+	assert tmp.parse_response("a@example.com <!-- b@example.com --> c@example.com") == {"email": ["a@example.com", "c@example.com"]}
+	assert tmp.parse_response("<!-- b@example.com -->") == {}
+
+@pytest.mark.parametrize("query", [r"x+a?b?", r"\w+", r"(x)a?", r"(x+)b", r"a|xa", r"xa*|a\s+b", r"(?:ab|x)+", r"[^E]{2}"]) # anchors and lookarounds see past the gaps
+def test_gaps_match_reference(query: str):
+	rand = random.Random(query)
+	excludes = ["E", "EE", r"b\n"]
+	tmp = get_matcher({"key": {"extract": query}}, excludes)
+	for _ in range(300):
+		content  = "".join(rand.choice("xabE \n") for _ in range(rand.randint(0, 24)))
+		expected = search_gaps(query, excludes, content)
+		result   = tmp.parse_response(content).get("key", [])
+		assert result == array.unique(expected, sort = True), content
+
+def test_parse_window():
+	tmp     = get_matcher({"email": {"extract": r"[\w.]+@example\.com"}})
+	content = "a@example.com b@example.com a@example.com"
+	assert tmp.parse_window(content, 0, len(content)) == {"email": {"a@example.com": [0, 28], "b@example.com": [14]}}
+	assert tmp.parse_window(content, 1, 28) == {"email": {"b@example.com": [14]}}
+	assert tmp.parse_window(content, 28, 29) == {"email": {"a@example.com": [28]}}
+
+def test_parse_window_group_offset():
+	tmp = get_matcher({"id": {"extract": r"id=(\d+)"}}, ["E"])
+	assert tmp.parse_window("id=12 E id=34", 0, 13) == {"id": {"12": [3], "34": [11]}}
+
+def test_literals_do_not_skip_matches():
+	tmp = get_matcher({"link": {"extract": r"https?://t\.me/\w+"}})
+	assert tmp.parse_response("HTTP://T.ME/chad") == {"link": ["HTTP://T.ME/chad"]}
+	assert tmp.parse_response("https://example.com") == {}
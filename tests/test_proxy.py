@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+from chad.utils import config, proxy
+
+def test_cooldown_doubles_until_removed():
+	tmp = proxy.Proxies(["http://a:8080", "http://b:8080"], 10)
+	cooldowns = [tmp.failed("http://a:8080") for _ in range(config.PROXY_MAX_FAILURES - 1)]
+	assert [cooldown for cooldown, message in cooldowns] == [10 * 2 ** i for i in range(config.PROXY_MAX_FAILURES - 1)]
+	assert all(not message for cooldown, message in cooldowns)
+	cooldown, message = tmp.failed("http://a:8080")
+	assert cooldown == 0 and "http://a:8080" in message
+	assert tmp.get_all() == ["http://b:8080"]
+	assert tmp.failed("http://a:8080") == (0, "")
+
+def test_cooldown_is_capped():
+	tmp = proxy.Proxies(["http://a:8080"], config.PROXY_MAX_COOLDOWN)
+	tmp.failed("http://a:8080")
+	assert tmp.failed("http://a:8080")[0] == config.PROXY_MAX_COOLDOWN
+
+def test_success_resets_strikes():
+	tmp = proxy.Proxies(["http://a:8080"], 10)
+	for _ in range(config.PROXY_MAX_FAILURES - 1):
+		tmp.failed("http://a:8080")
+	tmp.succeeded("http://a:8080", None)
+	assert tmp.failed("http://a:8080") == (10, "")
+	assert not tmp.is_empty()
+
+def test_get_best():
+	tmp = proxy.Proxies(["http://a:8080", "http://b:8080", "http://c:8080"], 10)
+	tmp.succeeded("http://a:8080", 2.0)
+	tmp.succeeded("http://b:8080", 0.5)
+	assert tmp.get_best(tmp.get_all()) == "http://b:8080"
+	for _ in range(config.PROXY_MAX_FAILURES - 1):
+		tmp.failed("http://b:8080")
+	assert tmp.get_best(tmp.get_all()) == "http://c:8080" # scored with the average latency
+	assert tmp.get_best(["http://a:8080", "http://unknown:8080"]) == "http://a:8080"
+	assert tmp.get_best(["http://unknown:8080"]) == ""
+
+def test_failed_only_proxy_is_not_preferred():
+	tmp = proxy.Proxies(["http://a:8080", "http://b:8080"], 10)
+	tmp.failed("http://a:8080")
+	tmp.succeeded("http://b:8080", None)
+	assert tmp.get_best(tmp.get_all()) == "http://b:8080"
+	assert proxy.Health(failures = 1).get_score(1.0) > proxy.Health().get_score(1.0)